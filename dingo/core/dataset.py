@@ -1,4 +1,6 @@
 import ast
+import copy
+import os
 import h5py
 import numpy as np
 import pandas as pd
@@ -24,12 +26,21 @@ def recursive_hdf5_save(group, d):
             raise TypeError(f"Cannot save datatype {type(v)} as hdf5 dataset.")
 
 
-def recursive_hdf5_load(group, keys=None):
+def recursive_hdf5_load(group, keys=None, precision=None):
+    """
+    Load (selected keys of) an HDF5 group into a nested dictionary.
+
+    If precision ('single' or 'double') is provided, real and complex arrays are
+    converted to the corresponding dtype by HDF5 during the read, such that no copy
+    at the stored precision is held in memory.
+    """
     d = {}
     for k, v in group.items():
         if keys is None or k in keys:
             if isinstance(v, h5py.Group):
-                d[k] = recursive_hdf5_load(v)
+                d[k] = recursive_hdf5_load(v, precision=precision)
+            elif precision is not None and v.dtype.kind in "fc" and v.size > 1:
+                d[k] = v.astype(_precision_dtype(v.dtype, precision))[...]
             else:
                 d[k] = v[...]
                 # If the array has column names, load it as a pandas DataFrame
@@ -48,6 +59,113 @@ def recursive_hdf5_load(group, keys=None):
     return d
 
 
+def _precision_dtype(dtype, precision):
+    if precision == "single":
+        return np.complex64 if dtype.kind == "c" else np.float32
+    elif precision == "double":
+        return np.complex128 if dtype.kind == "c" else np.float64
+    else:
+        raise TypeError('precision can only be changed to "single" or "double".')
+
+
+class HDF5ArrayView:
+    """Array-like view of an HDF5 dataset, which reads only the requested rows from
+    disk when indexed. This allows for working with datasets that are too large to
+    hold in memory, e.g., when a DataLoader only ever requires a batch at a time.
+
+    The file is opened on first access. The open file handle is tied to the process
+    that opened it: h5py file handles cannot be shared with forked DataLoader workers,
+    so a worker that inherits an open view (e.g., after the dataset was accessed in
+    the parent process) reopens the file. The file can be closed explicitly with
+    close(), and is closed when the view is deleted.
+    """
+
+    def __init__(self, file_name, key, dtype=None):
+        """
+        Parameters
+        ----------
+        file_name : str
+            HDF5 file containing the dataset.
+        key : str
+            Path of the dataset within the file, e.g., "polarizations/h_plus".
+        dtype : np.dtype
+            If provided, data are converted to this dtype when read.
+        """
+        self.file_name = file_name
+        self.key = key
+        self.dtype = dtype
+        # Functions applied (in order) to the data after reading, see with_transform().
+        # These must be picklable, such that the view can be sent to worker processes.
+        self.transforms = []
+        self._file = None
+        self._dataset = None
+        # Process in which self._file was opened.
+        self._pid = None
+        with h5py.File(file_name, "r") as f:
+            self.shape = f[key].shape
+            if self.dtype is None:
+                self.dtype = f[key].dtype
+
+    def with_transform(self, transform):
+        """Return a new view that additionally applies transform (e.g., a domain
+        update or truncation) to data when read. The new view opens its own file
+        handle."""
+        view = copy.copy(self)
+        view.transforms = self.transforms + [transform]
+        view._file = None
+        view._dataset = None
+        view._pid = None
+        return view
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_file"] = None
+        state["_dataset"] = None
+        state["_pid"] = None
+        return state
+
+    def _get_dataset(self):
+        """Return the h5py dataset, (re)opening the file if it has not been opened in
+        the current process."""
+        if self._dataset is None or self._pid != os.getpid():
+            # A handle inherited from the parent process is dropped without closing
+            # it, since it belongs to the parent.
+            self._file = h5py.File(self.file_name, "r", swmr=True)
+            self._dataset = self._file[self.key]
+            self._pid = os.getpid()
+        return self._dataset
+
+    def close(self):
+        """Close the file, if it was opened by the current process."""
+        if self._file is not None and self._pid == os.getpid():
+            self._file.close()
+        self._file = None
+        self._dataset = None
+        self._pid = None
+
+    def __del__(self):
+        # The attributes may be missing if __init__ failed.
+        if getattr(self, "_file", None) is not None:
+            self.close()
+
+    def __getitem__(self, idx):
+        dataset = self._get_dataset()
+        if np.ndim(idx) == 0:
+            data = dataset[idx]
+        else:
+            # h5py requires increasing indices, so read the unique sorted indices in
+            # one go and restore the requested order afterwards.
+            idx, inverse = np.unique(np.asarray(idx), return_inverse=True)
+            data = dataset[idx][inverse]
+        data = data.astype(self.dtype, copy=False)
+        for transform in self.transforms:
+            data = transform(data)
+        return data
+
+
 class DingoDataset:
     """This is a generic dataset class with save / load methods.
 
@@ -107,11 +225,13 @@ class DingoDataset:
             if self.dataset_type:
                 f.attrs["dataset_type"] = self.dataset_type
 
-    def from_file(self, file_name):
+    def from_file(self, file_name, precision=None, keys=None):
         print("Loading dataset from " + str(file_name) + ".")
+        if keys is None:
+            keys = self._data_keys
         with h5py.File(file_name, "r") as f:
             # Load only the keys that the class expects
-            loaded_dict = recursive_hdf5_load(f, keys=self._data_keys)
+            loaded_dict = recursive_hdf5_load(f, keys=keys, precision=precision)
             for k, v in loaded_dict.items():
                 assert k in self._data_keys
                 vars(self)[k] = v
@@ -1,19 +1,15 @@
-from functools import partial
-from multiprocessing import Pool
-from itertools import starmap
-
 import numpy as np
+import torch
 from bilby.core.prior import Interped
-from threadpoolctl import threadpool_limits
 
 
-def interpolated_sample_and_log_prob_multi(
-    sample_points, values, num_processes: int = 1
-):
+def interpolated_sample_and_log_prob_multi(sample_points, values, device=None):
     """
     Given a distribution discretized on a grid, return a sample and the log prob from an
-    interpolated distribution. Wraps the bilby.core.prior.Interped class. Works with
-    multiprocessing.
+    interpolated distribution. Vectorized equivalent of the bilby.core.prior.Interped
+    class (see interpolated_sample_and_log_prob), applied to a batch of distributions:
+    the pdf is interpolated linearly, and samples are drawn by linear interpolation of
+    the inverse of the trapezoidal cdf.
 
     Parameters
     ----------
@@ -22,25 +18,67 @@ def interpolated_sample_and_log_prob_multi(
     values : np.ndarray, shape (B, N)
         y values for samples. The distributions do not have to be initially
         normalized, although the final log_probs will be. B = batch dimension.
-    num_processes : int
-        Number of parallel processes to use.
+    device : str or torch.device, optional
+        If provided, the computation is carried out with torch on this device (e.g.,
+        "cuda"). Random numbers are then drawn from the torch generator.
 
     Returns
     -------
     (np.ndarray, np.ndarray) : sample and log_prob arrays, each of length B
     """
-    with threadpool_limits(limits=1, user_api="blas"):
-        data_generator = iter(values)
-        task_fun = partial(interpolated_sample_and_log_prob, sample_points)
-        if num_processes > 1:
-            with Pool(processes=num_processes) as pool:
-                result_list = pool.map(task_fun, data_generator)
-        else:
-            result_list = list(map(task_fun, data_generator))
-    sample, log_prob = np.array(result_list).T
+    if device is not None:
+        return _interpolated_sample_and_log_prob_torch(sample_points, values, device)
+
+    pdf, cdf = _normalized_pdf_and_cdf(sample_points, values)
+    u = np.random.random_sample(len(cdf))[:, None]
+
+    # For each row, index j of the first grid point with cdf >= u.
+    j = np.clip(np.sum(cdf < u, axis=1), 1, len(sample_points) - 1)[:, None]
+    cdf_lower = np.take_along_axis(cdf, j - 1, axis=1)
+    cdf_upper = np.take_along_axis(cdf, j, axis=1)
+    delta_cdf = cdf_upper - cdf_lower
+    fraction = np.divide(
+        u - cdf_lower, delta_cdf, out=np.zeros_like(u), where=delta_cdf > 0
+    )
+    x_lower = sample_points[j - 1]
+    sample = (x_lower + fraction * (sample_points[j] - x_lower))[:, 0]
+
+    log_prob = np.log(_interpolate_rows(sample_points, pdf, sample))
     return sample, log_prob
 
 
+def _interpolated_sample_and_log_prob_torch(sample_points, values, device):
+    """Torch implementation of interpolated_sample_and_log_prob_multi."""
+    x = torch.as_tensor(sample_points, dtype=torch.float64, device=device)
+    y = torch.as_tensor(values, dtype=torch.float64, device=device)
+    n = len(x)
+
+    areas = 0.5 * (y[:, 1:] + y[:, :-1]) * torch.diff(x)
+    cdf = torch.zeros_like(y)
+    cdf[:, 1:] = torch.cumsum(areas, dim=1)
+    norm = cdf[:, -1:].clone()
+    cdf /= norm
+    cdf[:, -1] = 1.0
+    pdf = y / norm
+
+    u = torch.rand((len(y), 1), dtype=torch.float64, device=device)
+    j = torch.searchsorted(cdf, u).clamp(1, n - 1)
+    cdf_lower, cdf_upper = cdf.gather(1, j - 1), cdf.gather(1, j)
+    delta_cdf = cdf_upper - cdf_lower
+    fraction = torch.where(
+        delta_cdf > 0, (u - cdf_lower) / delta_cdf, torch.zeros_like(u)
+    )
+    x_lower, x_upper = x[j - 1], x[j]
+    sample = x_lower + fraction * (x_upper - x_lower)
+
+    # The sample lies in [x_lower, x_upper], so interpolate the pdf on that interval.
+    pdf_lower, pdf_upper = pdf.gather(1, j - 1), pdf.gather(1, j)
+    prob = pdf_lower + (sample - x_lower) / (x_upper - x_lower) * (
+        pdf_upper - pdf_lower
+    )
+    return sample[:, 0].cpu().numpy(), torch.log(prob[:, 0]).cpu().numpy()
+
+
 def interpolated_sample_and_log_prob(sample_points, values):
     """
     Given a distribution discretized on a grid, return a sample and the log prob from an
@@ -64,13 +102,12 @@ def interpolated_sample_and_log_prob(sample_points, values):
     return sample, log_prob
 
 
-def interpolated_log_prob_multi(
-    sample_points, values, evaluation_points, num_processes: int = 1
-):
+def interpolated_log_prob_multi(sample_points, values, evaluation_points):
     """
     Given a distribution discretized on a grid, the log prob at a specific point
-    using an interpolated distribution. Wraps the bilby.core.prior.Interped class.
-    Works with multiprocessing.
+    using an interpolated distribution. Vectorized equivalent of the
+    bilby.core.prior.Interped class (see interpolated_log_prob), applied to a batch of
+    distributions.
 
     Parameters
     ----------
@@ -81,22 +118,54 @@ def interpolated_log_prob_multi(
         normalized, although the final log_probs will be. B = batch dimension.
     evaluation_points : np.ndarray, shape (B)
         x values at which to evaluate log_prob.
-    num_processes : int
-        Number of parallel processes to use.
 
     Returns
     -------
-    (np.ndarray, np.ndarray) : sample and log_prob arrays, each of length B
+    np.ndarray : log_prob array of length B
+    """
+    pdf, _ = _normalized_pdf_and_cdf(sample_points, values)
+    return np.log(_interpolate_rows(sample_points, pdf, evaluation_points))
+
+
+def _normalized_pdf_and_cdf(sample_points, values):
+    """
+    Normalize a batch of distributions with the trapezoidal rule.
+
+    Returns
+    -------
+    (np.ndarray, np.ndarray) : pdf and cdf, each of shape (B, N)
+    """
+    sample_points = np.asarray(sample_points)
+    values = np.atleast_2d(values)
+    areas = 0.5 * (values[:, 1:] + values[:, :-1]) * np.diff(sample_points)
+    cdf = np.zeros(values.shape)
+    np.cumsum(areas, axis=1, out=cdf[:, 1:])
+    norm = cdf[:, -1:].copy()
+    cdf /= norm
+    # As in Interped, the last element of the cdf needs to be exactly one.
+    cdf[:, -1] = 1.0
+    return values / norm, cdf
+
+
+def _interpolate_rows(sample_points, values, evaluation_points):
+    """
+    Linearly interpolate row b of values at evaluation_points[b]. Returns 0 outside of
+    the range of sample_points.
     """
-    with threadpool_limits(limits=1, user_api="blas"):
-        data_generator = zip(iter(values), iter(evaluation_points))
-        task_fun = partial(interpolated_log_prob, sample_points)
-        if num_processes > 1:
-            with Pool(processes=num_processes) as pool:
-                result_list = pool.starmap(task_fun, data_generator)
-        else:
-            result_list = list(starmap(task_fun, data_generator))
-    return np.array(result_list)
+    evaluation_points = np.asarray(evaluation_points, dtype=float)
+    rows = np.arange(len(values))
+    j = np.searchsorted(sample_points, evaluation_points)
+    j = np.clip(j, 1, len(sample_points) - 1)
+    x_lower, x_upper = sample_points[j - 1], sample_points[j]
+    y_lower, y_upper = values[rows, j - 1], values[rows, j]
+    result = y_lower + (evaluation_points - x_lower) / (x_upper - x_lower) * (
+        y_upper - y_lower
+    )
+    outside = (evaluation_points < sample_points[0]) | (
+        evaluation_points > sample_points[-1]
+    )
+    result[outside] = 0.0
+    return result
 
 
 def interpolated_log_prob(sample_points, values, evaluation_point):
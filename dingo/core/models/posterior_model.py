@@ -157,7 +157,8 @@ class PosteriorModel:
         Parameters
         ----------
         model_filename: str
-            filename for saving the model
+            filename for saving the model; a writable file-like object is also
+            accepted
         save_training_info: bool
             specifies whether information required to proceed with training is
             saved, e.g. optimizer state dict
@@ -323,8 +324,9 @@ class PosteriorModel:
         if test_only:
             test_loss = test_epoch(self, test_loader)
             print(f"test loss: {test_loss:.3f}")
+            return
 
-        else:
+        try:
             while not runtime_limits.limits_exceeded(self.epoch):
                 self.epoch += 1
 
@@ -379,6 +381,17 @@ class PosteriorModel:
                         print("wandb not installed. Skipping logging to wandb.")
 
                 print(f"Finished training epoch {self.epoch}.\n")
+        except BaseException:
+            # Wait for the last model to be written, but do not let an error from the
+            # write replace the exception raised during training.
+            try:
+                utils.wait_for_checkpoint()
+            except Exception as e:
+                print(f"Writing the last model to disk failed: {e}")
+            raise
+
+        # make sure the last model has been written to disk
+        utils.wait_for_checkpoint()
 
     def sample(
         self,
@@ -455,7 +468,7 @@ def train_epoch(pm, dataloader):
     )
 
     for batch_idx, data in enumerate(dataloader):
-        loss_info.update_timer()
+        loss_info.update_timer_dl()
         pm.optimizer.zero_grad()
         # data to device
         data = [d.to(pm.device, non_blocking=True) for d in data]
@@ -483,7 +496,7 @@ def test_epoch(pm, dataloader):
         )
 
         for batch_idx, data in enumerate(dataloader):
-            loss_info.update_timer()
+            loss_info.update_timer_dl()
             # data to device
             data = [d.to(pm.device, non_blocking=True) for d in data]
             # compute loss
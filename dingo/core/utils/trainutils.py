@@ -1,27 +1,32 @@
+import sys
 import time
 import os
-from os.path import join, isfile
-import csv
+import io
+import shutil
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+from os.path import join
 
+import numpy as np
 
-class AvgTracker:
-    def __init__(self):
-        self.sum = 0
-        self.N = 0
-        self.x = None
-
-    def update(self, x, n=1):
-        self.sum += x
-        self.N += n
-        self.x = x
-
-    def get_avg(self):
-        if self.N == 0:
-            return float("nan")
-        return self.sum / self.N
+# Row indices into LossInfo._stats
+_LOSS, _DATALOADER, _NETWORK = 0, 1, 2
 
 
 class LossInfo:
+    __slots__ = (
+        "epoch",
+        "len_dataset",
+        "batch_size",
+        "mode",
+        "print_freq",
+        "_stats",
+        "_last",
+        "loss",
+        "_time_enabled",
+        "t",
+    )
+
     def __init__(self, epoch, len_dataset, batch_size, mode="Train", print_freq=1):
         # data for print statements
         self.epoch = epoch
@@ -29,44 +34,74 @@ class LossInfo:
         self.batch_size = batch_size
         self.mode = mode
         self.print_freq = print_freq
-        # track loss
-        self.loss_tracker = AvgTracker()
+        # track [sum, N] and the last value of the loss and the computation times
+        self._stats = np.zeros((3, 2))
+        self._last = np.zeros(3)
         self.loss = None
-        # track computation times
-        self.times = {"Dataloader": AvgTracker(), "Network": AvgTracker()}
-        self.t = time.time()
+        # track computation times, only required if info is printed
+        self._time_enabled = print_freq is not None and 0 < print_freq < float("inf")
+        self.t = time.perf_counter_ns()
+
+    def _update_timer(self, idx):
+        t = time.perf_counter_ns()
+        dt = (t - self.t) * 1e-9
+        self._stats[idx] += (dt, 1)
+        self._last[idx] = dt
+        self.t = t
+
+    def update_timer_dl(self):
+        """Record the time spent in the dataloader since the last timer update."""
+        if self._time_enabled:
+            self._update_timer(_DATALOADER)
+
+    def update_timer_net(self):
+        """Record the time spent in the network since the last timer update."""
+        if self._time_enabled:
+            self._update_timer(_NETWORK)
 
     def update_timer(self, timer_mode="Dataloader"):
-        self.times[timer_mode].update(time.time() - self.t)
-        self.t = time.time()
+        if timer_mode == "Dataloader":
+            self.update_timer_dl()
+        elif timer_mode == "Network":
+            self.update_timer_net()
+        else:
+            raise KeyError(f"Unknown timer mode {timer_mode}.")
+
+    @property
+    def times(self):
+        """Dict with (last, average) computation times per timer mode."""
+        return {
+            "Dataloader": (self._last[_DATALOADER], self.get_avg(_DATALOADER)),
+            "Network": (self._last[_NETWORK], self.get_avg(_NETWORK)),
+        }
 
     def update(self, loss, n):
         self.loss = loss
-        self.loss_tracker.update(loss * n, n)
-        self.update_timer(timer_mode="Network")
+        self._stats[_LOSS] += (loss * n, n)
+        self._last[_LOSS] = loss
+        self.update_timer_net()
 
-    def get_avg(self):
-        return self.loss_tracker.get_avg()
+    def get_avg(self, idx=_LOSS):
+        total, n = self._stats[idx]
+        if n == 0:
+            return float("nan")
+        return float(total / n)
 
     def print_info(self, batch_idx):
-        if batch_idx % self.print_freq == 0:
-            print(
-                "{} Epoch: {} [{}/{} ({:.0f}%)]".format(
-                    self.mode,
-                    self.epoch,
-                    min(batch_idx * self.batch_size, self.len_dataset),
-                    self.len_dataset,
-                    100.0 * batch_idx * self.batch_size / self.len_dataset,
-                ),
-                end="\t\t",
+        if self._time_enabled and batch_idx % self.print_freq == 0:
+            seen = batch_idx * self.batch_size
+            capped = seen if seen < self.len_dataset else self.len_dataset
+            pct = 100.0 * seen / self.len_dataset
+            times = self.times
+            td, td_avg = times["Dataloader"]
+            tn, tn_avg = times["Network"]
+            sys.stdout.write(
+                f"{self.mode} Epoch: {self.epoch} "
+                f"[{capped}/{self.len_dataset} ({pct:.0f}%)]\t\t"
+                f"Loss: {self.loss:.3f} ({self.get_avg():.3f})\t\t"
+                f"Time Dataloader: {td:.3f} ({td_avg:.3f})\t\t"
+                f"Time Network: {tn:.3f} ({tn_avg:.3f})\n"
             )
-            # print loss
-            print(f"Loss: {self.loss:.3f} ({self.get_avg():.3f})", end="\t\t")
-            # print computation times
-            td, td_avg = self.times["Dataloader"].x, self.times["Dataloader"].get_avg()
-            tn, tn_avg = self.times["Network"].x, self.times["Network"].get_avg()
-            print(f"Time Dataloader: {td:.3f} ({td_avg:.3f})", end="\t\t")
-            print(f"Time Network: {tn:.3f} ({tn_avg:.3f})")
 
 
 class RuntimeLimits:
@@ -75,6 +110,14 @@ class RuntimeLimits:
     of epochs for model).
     """
 
+    __slots__ = (
+        "max_time_per_run",
+        "max_epochs_per_run",
+        "max_epochs_total",
+        "epoch_start",
+        "time_start",
+    )
+
     def __init__(
         self,
         max_time_per_run: float = None,
@@ -100,7 +143,7 @@ class RuntimeLimits:
         self.max_epochs_per_run = max_epochs_per_run
         self.max_epochs_total = max_epochs_total
         self.epoch_start = epoch_start
-        self.time_start = time.time()
+        self.time_start = time.monotonic()
         if max_epochs_per_run is not None and epoch_start is None:
             raise ValueError("epoch_start required to check " "max_epochs_per_run.")
 
@@ -120,7 +163,7 @@ class RuntimeLimits:
         """
         # check time limit for run
         if self.max_time_per_run is not None:
-            if time.time() - self.time_start >= self.max_time_per_run:
+            if time.monotonic() - self.time_start >= self.max_time_per_run:
                 print(
                     f"Stop run: Time limit of {self.max_time_per_run} s " f"exceeded."
                 )
@@ -160,7 +203,7 @@ class RuntimeLimits:
         """
         # check time limit for run
         if self.max_time_per_run is not None:
-            if time.time() - self.time_start >= self.max_time_per_run:
+            if time.monotonic() - self.time_start >= self.max_time_per_run:
                 return True
         # check epoch limit for run
         if self.max_epochs_per_run is not None:
@@ -172,6 +215,17 @@ class RuntimeLimits:
         return False
 
 
+# Open history files, keyed by path, see write_history.
+_HISTORY_HANDLES = {}
+
+
+@atexit.register
+def _close_history_files():
+    for f in _HISTORY_HANDLES.values():
+        f.close()
+    _HISTORY_HANDLES.clear()
+
+
 def write_history(
     log_dir,
     epoch,
@@ -182,7 +236,7 @@ def write_history(
     filename="history.txt",
 ):
     """
-    Writes losses and learning rate history to csv file.
+    Writes losses and learning rate history to tab-separated csv file.
 
     Parameters
     ----------
@@ -205,23 +259,81 @@ def write_history(
         aux = []
     history_file = join(log_dir, filename)
     if epoch == 1:
-        assert not isfile(
-            history_file
-        ), f"File {history_file} exists, aborting to not overwrite it."
-
-    with open(history_file, "w" if epoch == 1 else "a") as f:
-        writer = csv.writer(f, delimiter="\t")
-        writer.writerow([epoch, train_loss, test_loss, *learning_rates, *aux])
+        # drop a stale handle, e.g., if the file was removed for a new run
+        if history_file in _HISTORY_HANDLES:
+            _HISTORY_HANDLES.pop(history_file).close()
+        try:
+            _HISTORY_HANDLES[history_file] = open(history_file, "x")
+        except FileExistsError:
+            raise AssertionError(
+                f"File {history_file} exists, aborting to not overwrite it."
+            )
+    elif history_file not in _HISTORY_HANDLES:
+        # keep the file open across epochs, and only flush after each write
+        _HISTORY_HANDLES[history_file] = open(history_file, "a")
+    f = _HISTORY_HANDLES[history_file]
+    # tab-separated row; numeric fields need no csv quoting
+    row = [epoch, train_loss, test_loss, *learning_rates, *aux]
+    f.write("\t".join(map(str, row)) + "\n")
+    f.flush()
 
 
 def copyfile(src, dst):
     """
-    copy src to dst.
+    copy src to dst, preserving access and modification times (like cp -p).
+
+    The copy is staged in a temporary file next to dst and then moved into
+    place, such that dst is never left in a partially written state.
     :param src:
     :param dst:
     :return:
     """
-    os.system("cp -p %s %s" % (src, dst))
+    tmp = dst + ".tmp"
+    shutil.copyfile(src, tmp)
+    st = os.stat(src)
+    os.utime(tmp, ns=(st.st_atime_ns, st.st_mtime_ns))
+    os.replace(tmp, dst)
+
+
+# Single background worker for writing files to disk. At most one write is in
+# flight at any time, see submit_background_write and wait_for_checkpoint.
+_CKPT_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+_pending = None
+
+
+def wait_for_checkpoint():
+    """
+    Block until the write submitted by the last call of save_model (or
+    submit_background_write) is complete. Exceptions raised during the write are
+    re-raised here.
+    """
+    global _pending
+    if _pending is not None:
+        future, _pending = _pending, None
+        future.result()
+
+
+def submit_background_write(fn, *args, **kwargs):
+    """
+    Call fn(*args, **kwargs) in the background writer thread, after waiting for
+    any previously submitted write to complete.
+
+    Returns
+    -------
+    concurrent.futures.Future
+        Future of the write. Use wait_for_checkpoint to block until it is complete.
+    """
+    global _pending
+    wait_for_checkpoint()
+    _pending = _CKPT_EXECUTOR.submit(fn, *args, **kwargs)
+    return _pending
+
+
+def _write_model(buffer, model_name, model_name_cp=None):
+    with open(model_name, "wb") as f:
+        f.write(buffer.getbuffer())
+    if model_name_cp is not None:
+        copyfile(model_name, model_name_cp)
 
 
 def save_model(pm, log_dir, model_prefix="model", checkpoint_epochs=None):
@@ -229,6 +341,10 @@ def save_model(pm, log_dir, model_prefix="model", checkpoint_epochs=None):
     Save model to <model_prefix>_latest.pt in log_dir. Additionally,
     all checkpoint_epochs a permanent checkpoint is saved.
 
+    The model is serialized to memory synchronously, but written to disk in a
+    background thread such that training can proceed in the meantime. Call
+    wait_for_checkpoint to make sure that the files are complete.
+
     Parameters
     ----------
     pm:
@@ -240,15 +356,21 @@ def save_model(pm, log_dir, model_prefix="model", checkpoint_epochs=None):
     checkpoint_epochs: int = None
         number of steps between two consecutive model checkpoints
     """
-    # save current model
+    # serialize current model on the main thread, such that later updates of the
+    # model parameters do not affect the saved state. torch.save already copies
+    # device tensors to host memory while serializing, so the state is not staged
+    # in a separate pinned buffer first (this would only add a second copy).
     model_name = join(log_dir, f"{model_prefix}_latest.pt")
     print(f"Saving model to {model_name}.", end=" ")
-    pm.save_model(model_name, save_training_info=True)
-    print("Done.")
+    buffer = io.BytesIO()
+    pm.save_model(buffer, save_training_info=True)
 
     # potentially copy model to a checkpoint
+    model_name_cp = None
     if checkpoint_epochs is not None and pm.epoch % checkpoint_epochs == 0:
         model_name_cp = join(log_dir, f"{model_prefix}_{pm.epoch:03d}.pt")
         print(f"Copy model to checkpoint {model_name_cp}.", end=" ")
-        copyfile(model_name, model_name_cp)
-        print("Done.")
+
+    # write to disk in the background, with at most one write in flight
+    submit_background_write(_write_model, buffer, model_name, model_name_cp)
+    print("Queued for writing.")
@@ -5,6 +5,13 @@ from sklearn.utils.extmath import randomized_svd
 from dingo.core.dataset import DingoDataset
 
 
+def _conjugate_transpose(a: np.ndarray):
+    """Conjugate transpose of a 2D array, computed in a single pass into a
+    C-contiguous array of the same dtype."""
+    out = np.empty(a.shape[::-1], dtype=a.dtype)
+    return np.conjugate(a.T, out=out)
+
+
 class SVDBasis(DingoDataset):
 
     dataset_type = "svd_basis"
@@ -51,7 +58,7 @@ class SVDBasis(DingoDataset):
             U, s, Vh = randomized_svd(training_data, n, random_state=0)
 
             self.Vh = Vh.astype(np.complex128)  # TODO: fix types
-            self.V = self.Vh.T.conj()
+            self.V = _conjugate_transpose(self.Vh)
             self.n = n
             self.s = s
         elif method == "scipy":
@@ -179,7 +186,7 @@ class SVDBasis(DingoDataset):
         super().from_file(filename)
         if self.V is None:
             raise KeyError("File does not contain SVD V matrix. No SVD basis to load.")
-        self.Vh = self.V.T.conj()
+        self.Vh = _conjugate_transpose(self.V)
         self.n = self.V.shape[1]
 
     def from_dictionary(self, dictionary: dict):
@@ -194,7 +201,7 @@ class SVDBasis(DingoDataset):
         super().from_dictionary(dictionary)
         if self.V is None:
             raise KeyError("dict does not contain SVD V matrix. No SVD basis to load.")
-        self.Vh = self.V.T.conj()
+        self.Vh = _conjugate_transpose(self.V)
         self.n = self.V.shape[1]
 
     # def truncate(self, n: int):
@@ -245,4 +252,8 @@ class ApplySVD(object):
             func = self.svd_basis.compress
         else:
             func = self.svd_basis.decompress
-        return {k: func(v) for k, v in waveform.items()}
+        # Stack the polarizations so that a single matrix product transforms all of
+        # them at once.
+        keys = list(waveform.keys())
+        result = func(np.stack([waveform[k] for k in keys]))
+        return dict(zip(keys, result))
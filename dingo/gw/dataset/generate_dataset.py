@@ -51,7 +51,7 @@ def generate_parameters_and_polarizations(
         with threadpool_limits(limits=1, user_api="blas"):
             with Pool(processes=num_processes) as pool:
                 polarizations = generate_waveforms_parallel(
-                    waveform_generator, parameters, pool
+                    waveform_generator, parameters, pool, num_processes
                 )
     else:
         polarizations = generate_waveforms_parallel(waveform_generator, parameters)
@@ -1,15 +1,23 @@
 import copy
+from functools import partial
 from typing import Dict, Union
+import h5py
 import numpy as np
 import torch.utils.data
 from torchvision.transforms import Compose
 
-from dingo.core.dataset import DingoDataset
+from dingo.core.dataset import DingoDataset, HDF5ArrayView, _precision_dtype
 from dingo.gw.SVD import SVDBasis, ApplySVD
 from dingo.gw.domains import build_domain
 from dingo.gw.transforms import WhitenFixedASD
 
 
+def _truncate_last_axis(x, size):
+    """Truncate the last axis of x to the given size. Defined at module level (rather
+    than as a lambda) so that lazily loaded datasets remain picklable."""
+    return x[..., :size]
+
+
 class WaveformDataset(DingoDataset, torch.utils.data.Dataset):
     """This class stores a dataset of waveforms (polarizations) and corresponding
     parameters.
@@ -31,6 +39,7 @@ class WaveformDataset(DingoDataset, torch.utils.data.Dataset):
         precision=None,
         domain_update=None,
         svd_size_update=None,
+        lazy=False,
     ):
         """
         For constructing, provide either file_name, or dictionary containing data and
@@ -51,11 +60,17 @@ class WaveformDataset(DingoDataset, torch.utils.data.Dataset):
             If provided, update domain from existing domain using new settings.
         svd_size_update : int
             If provided, reduces the SVD size when decompressing (for speed).
+        lazy : bool
+            If True (and loading from file_name), polarizations are not loaded into
+            memory, but read from the file as they are accessed. Default: False.
         """
         self.domain = None
+        self.lazy = lazy
         self.transform = transform
         self.decompression_transform = None
         self.precision = precision
+        self._parameter_arrays = None
+        self._parameter_arrays_source = None
         super().__init__(
             file_name=file_name,
             dictionary=dictionary,
@@ -69,6 +84,24 @@ class WaveformDataset(DingoDataset, torch.utils.data.Dataset):
         ):
             self.load_supplemental(domain_update, svd_size_update)
 
+    def from_file(self, file_name):
+        # Convert arrays to the requested precision while reading, rather than
+        # afterwards in load_supplemental(). This avoids holding two copies in memory.
+        if not self.lazy:
+            super().from_file(file_name, precision=self.precision)
+        else:
+            keys = [k for k in self._data_keys if k != "polarizations"]
+            super().from_file(file_name, precision=self.precision, keys=keys)
+            with h5py.File(file_name, "r") as f:
+                self.polarizations = {}
+                for k, v in f["polarizations"].items():
+                    dtype = v.dtype
+                    if self.precision is not None:
+                        dtype = _precision_dtype(dtype, self.precision)
+                    self.polarizations[k] = HDF5ArrayView(
+                        file_name, f"polarizations/{k}", dtype=dtype
+                    )
+
     def load_supplemental(self, domain_update=None, svd_size_update=None):
         """Method called immediately after loading a dataset.
 
@@ -89,7 +122,8 @@ class WaveformDataset(DingoDataset, torch.utils.data.Dataset):
         # particular, this zeroes the waveforms for f < f_min.
         self.update_domain(domain_update)
 
-        # Update dtypes if necessary
+        # Update dtypes if necessary. This is a no-op for arrays that were already
+        # converted when loading from file.
         if self.precision is not None:
             if self.precision == "single":
                 complex_type = np.complex64
@@ -101,9 +135,15 @@ class WaveformDataset(DingoDataset, torch.utils.data.Dataset):
                 raise TypeError(
                     'precision can only be changed to "single" or "double".'
                 )
-            self.parameters = self.parameters.astype(real_type, copy=False)
+            # Only cast floating point columns, leaving e.g. integer columns untouched.
+            float_columns = self.parameters.select_dtypes("floating").columns
+            self.parameters = self.parameters.astype(
+                {k: real_type for k in float_columns}, copy=False
+            )
             for k, v in self.polarizations.items():
-                self.polarizations[k] = v.astype(complex_type, copy=False)
+                # Lazily loaded polarizations are converted when read.
+                if not isinstance(v, HDF5ArrayView):
+                    self.polarizations[k] = v.astype(complex_type, copy=False)
 
             # This should probably be moved to the SVDBasis class.
             if self.svd is not None:
@@ -147,7 +187,10 @@ class WaveformDataset(DingoDataset, torch.utils.data.Dataset):
             self.svd["V"] = self.domain.update_data(self.svd["V"], axis=0)
         else:
             for k, v in self.polarizations.items():
-                self.polarizations[k] = self.domain.update_data(v)
+                if isinstance(v, HDF5ArrayView):
+                    self.polarizations[k] = v.with_transform(self.domain.update_data)
+                else:
+                    self.polarizations[k] = self.domain.update_data(v)
 
     def initialize_decompression(self, svd_size_update: int = None):
         """
@@ -180,7 +223,12 @@ class WaveformDataset(DingoDataset, torch.utils.data.Dataset):
                 self.svd["V"] = self.svd["V"][:, :svd_size_update]
                 self.svd["s"] = self.svd["s"][:svd_size_update]
                 for k, v in self.polarizations.items():
-                    self.polarizations[k] = v[:, :svd_size_update]
+                    if isinstance(v, HDF5ArrayView):
+                        self.polarizations[k] = v.with_transform(
+                            partial(_truncate_last_axis, size=svd_size_update)
+                        )
+                    else:
+                        self.polarizations[k] = v[:, :svd_size_update]
 
             svd_basis = SVDBasis(dictionary=self.svd)
             decompression_transform_list.append(ApplySVD(svd_basis, inverse=True))
@@ -201,13 +249,29 @@ class WaveformDataset(DingoDataset, torch.utils.data.Dataset):
         """The number of waveform samples."""
         return len(self.parameters)
 
+    @property
+    def parameter_arrays(self) -> Dict[str, np.ndarray]:
+        """Parameters as a dict of column arrays (structure of arrays). Compared to
+        row access through the DataFrame, this is much cheaper in __getitem__(). The
+        cache is rebuilt whenever self.parameters is replaced."""
+        if self._parameter_arrays_source is not self.parameters:
+            self._parameter_arrays = {
+                k: v.to_numpy() for k, v in self.parameters.items()
+            }
+            self._parameter_arrays_source = self.parameters
+        return self._parameter_arrays
+
     def __getitem__(self, idx) -> Dict[str, Dict[str, Union[float, np.ndarray]]]:
         """
         Return a nested dictionary containing parameters and waveform polarizations
         for sample with index `idx`. If defined, a chain of transformations is applied to
         the waveform data.
         """
-        parameters = self.parameters.iloc[idx].to_dict()
+        if isinstance(idx, (int, np.integer)):
+            parameters = {k: v[idx].item() for k, v in self.parameter_arrays.items()}
+        else:
+            # Slices and arrays of indices are handled by the DataFrame.
+            parameters = self.parameters.iloc[idx].to_dict()
         polarizations = {
             pol: waveforms[idx] for pol, waveforms in self.polarizations.items()
         }
@@ -223,6 +287,32 @@ class WaveformDataset(DingoDataset, torch.utils.data.Dataset):
             data = self.transform(data)
         return data
 
+    def __getitems__(self, indices) -> list:
+        """
+        Return a list of samples for a batch of indices, equivalent to
+        [self[idx] for idx in indices]. The decompression transforms are applied to the
+        whole batch at once, such that SVD decompression amounts to a single matrix
+        product. This method is used automatically by torch DataLoaders.
+        """
+        indices = np.asarray(indices)
+        polarizations = {
+            pol: waveforms[indices] for pol, waveforms in self.polarizations.items()
+        }
+        if self.decompression_transform is not None:
+            polarizations = self.decompression_transform(polarizations)
+
+        parameter_arrays = self.parameter_arrays
+        batch = []
+        for j, idx in enumerate(indices):
+            data = {
+                "parameters": {k: v[idx].item() for k, v in parameter_arrays.items()},
+                "waveform": {pol: v[j] for pol, v in polarizations.items()},
+            }
+            if self.transform is not None:
+                data = self.transform(data)
+            batch.append(data)
+        return batch
+
     def parameter_mean_std(self):
         mean = self.parameters.mean().to_dict()
         std = self.parameters.std().to_dict()
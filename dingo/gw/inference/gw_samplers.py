@@ -2,9 +2,9 @@ from typing import Union
 
 import numpy as np
 import pandas as pd
-from astropy.time import Time
 from bilby.core.prior import PriorDict
 from bilby.gw.detector import InterferometerList
+from lal import GreenwichMeanSiderealTime
 from torchvision.transforms import Compose
 
 from dingo.core.samplers import Sampler, GNPESampler
@@ -42,6 +42,10 @@ class GWSamplerMixin(object):
         """
         super().__init__(**kwargs)
         self.t_ref = self.base_model_metadata["train_settings"]["data"]["ref_time"]
+        # t_ref is fixed, so cache its sidereal time for _correct_reference_time
+        self._gmst_ref = GreenwichMeanSiderealTime(float(self.t_ref))
+        # (t_event, ra_correction) of the last call of _correct_reference_time
+        self._ra_correction_cache = None
         self._pesummary_package = "gw"
         self._result_class = Result
 
@@ -88,26 +92,37 @@ class GWSamplerMixin(object):
         if self.event_metadata is not None:
             t_event = self.event_metadata.get("time_event")
             if t_event is not None and t_event != self.t_ref:
-                ra = samples["ra"]
-                time_reference = Time(self.t_ref, format="gps", scale="utc")
-                time_event = Time(t_event, format="gps", scale="utc")
-                longitude_event = time_event.sidereal_time("apparent", "greenwich")
-                longitude_reference = time_reference.sidereal_time(
-                    "apparent", "greenwich"
-                )
-                delta_longitude = longitude_event - longitude_reference
-                ra_correction = delta_longitude.rad
-                if not inverse:
-                    samples["ra"] = (ra + ra_correction) % (2 * np.pi)
-                else:
-                    samples["ra"] = (ra - ra_correction) % (2 * np.pi)
+                ra_correction = self._get_ra_correction(t_event)
+                if inverse:
+                    ra_correction = -ra_correction
+                # Allocate the corrected array once and wrap it in place. The input
+                # array is not modified, since it may be a read-only view of a
+                # DataFrame column.
+                ra = np.add(np.asarray(samples["ra"]), ra_correction)
+                np.mod(ra, 2 * np.pi, out=ra)
+                samples["ra"] = ra
+
+    def _get_ra_correction(self, t_event: float) -> float:
+        """
+        Difference in Greenwich sidereal time (rad) between t_event and t_ref. The
+        result is cached, and recomputed only if the event time changes.
+        """
+        if self._ra_correction_cache is None or self._ra_correction_cache[0] != t_event:
+            # Greenwich mean sidereal times; the equation of the equinoxes
+            # distinguishing these from apparent sidereal times cancels in the
+            # difference to well below the sky localization accuracy.
+            longitude_event = GreenwichMeanSiderealTime(float(t_event))
+            self._ra_correction_cache = (t_event, longitude_event - self._gmst_ref)
+        return self._ra_correction_cache[1]
 
     def _post_process(self, samples: Union[dict, pd.DataFrame], inverse: bool = False):
         """
         Post processing of parameter samples.
         * Correct the sky position for a potentially fixed reference time.
           (see self._correct_reference_time)
-        * Potentially sample a synthetic phase. (see self._sample_synthetic_phase)
+
+        Synthetic phase sampling is not part of the post processing, but is carried
+        out on the Result (see dingo.gw.result.Result.sample_synthetic_phase).
 
         This method modifies the samples in place.
 
@@ -120,19 +135,6 @@ class GWSamplerMixin(object):
         """
         if not self.unconditional_model:
             self._correct_reference_time(samples, inverse)
-        # if not inverse:
-        #     self._correct_reference_time(samples, inverse)
-        #     # if self.synthetic_phase_kwargs is not None:
-        #     #     print(f"Sampling synthetic phase.")
-        #     #     t0 = time.time()
-        #     #     self._sample_synthetic_phase(samples, inverse)
-        #     #     print(f"Done. This took {time.time() - t0:.2f} seconds.")
-        #
-        # # If inverting, we go in reverse order.
-        # else:
-        #     # if self.synthetic_phase_kwargs is not None:
-        #     #     self._sample_synthetic_phase(samples, inverse)
-        #     self._correct_reference_time(samples, inverse)
 
 
 class GWSampler(GWSamplerMixin, Sampler):
@@ -568,18 +568,15 @@ class StationaryGaussianGWLikelihood(GWSignal, Likelihood):
         complex : Inner product
         """
         with threadpool_limits(limits=1, user_api="blas"):
-            # Generator object for theta rows. For idx this yields row idx of
-            # theta dataframe, converted to dict, ready to be passed to
-            # self.log_likelihood.
-            theta_generator = (d[1].to_dict() for d in theta.iterrows())
+            # List of theta rows, converted to dicts in a single pass (much cheaper
+            # than iterrows()), ready to be passed to self.d_inner_h_complex.
+            theta_list = theta.to_dict(orient="records")
 
             if num_processes > 1:
                 with Pool(processes=num_processes) as pool:
-                    d_inner_h_complex = pool.map(
-                        self.d_inner_h_complex, theta_generator
-                    )
+                    d_inner_h_complex = pool.map(self.d_inner_h_complex, theta_list)
             else:
-                d_inner_h_complex = list(map(self.d_inner_h_complex, theta_generator))
+                d_inner_h_complex = list(map(self.d_inner_h_complex, theta_list))
 
         return np.array(d_inner_h_complex)
 
@@ -633,23 +630,16 @@ def inner_product(a, b, min_idx=0, delta_f=None, psd=None):
     delta_f: float
         Frequency resolution of the data. If None, a and b are assumed to be whitened
         and the inner product is computed without further whitening.
-    psd: np.ndarray = None
-        PSD of the data. If None, a and b are assumed to be whitened and the inner
-        product is computed without further whitening.
+    psd: np.ndarray or float = None
+        PSD of the data, either per frequency bin or a constant value. If None, a and
+        b are assumed to be whitened and the inner product is computed without
+        further whitening.
 
     Returns
     -------
     inner_product: float
     """
-    #
-    if psd is not None:
-        if delta_f is None:
-            raise ValueError(
-                "If unwhitened data is provided, both delta_f and psd must be provided."
-            )
-        return 4 * delta_f * np.sum((a.conj() * b / psd)[min_idx:], axis=0).real
-    else:
-        return np.sum((a.conj() * b)[min_idx:], axis=0).real
+    return inner_product_complex(a, b, min_idx, delta_f, psd).real
 
 
 def inner_product_complex(a, b, min_idx=0, delta_f=None, psd=None):
@@ -658,15 +648,25 @@ def inner_product_complex(a, b, min_idx=0, delta_f=None, psd=None):
     information is useful for the phase-marginalized likelihood. For further
     documentation see inner_product function.
     """
-    #
+    # Truncate before multiplying, rather than computing the full product.
+    a = a[min_idx:]
+    b = b[min_idx:]
     if psd is not None:
         if delta_f is None:
             raise ValueError(
                 "If unwhitened data is provided, both delta_f and psd must be provided."
             )
-        return 4 * delta_f * np.sum((a.conj() * b / psd)[min_idx:], axis=0)
+        # A scalar psd (e.g., a flat PSD) is applied to all bins.
+        b = b / (psd if np.ndim(psd) == 0 else psd[min_idx:])
+    if a.ndim == 1 and b.ndim == 1:
+        # Single BLAS call, without a temporary array for the product.
+        result = np.vdot(a, b)
+    else:
+        result = np.sum(a.conj() * b, axis=0)
+    if psd is not None:
+        return 4 * delta_f * result
     else:
-        return np.sum((a.conj() * b)[min_idx:], axis=0)
+        return result
 
 
 def build_stationary_gaussian_likelihood(
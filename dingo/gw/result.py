@@ -3,6 +3,7 @@ import time
 from typing import Optional
 
 import numpy as np
+import pandas as pd
 import yaml
 from bilby.core.prior import Uniform, Constraint, PriorDict
 
@@ -65,6 +66,12 @@ class Result(CoreResult):
     dataset_type = "gw_result"
 
     def __init__(self, **kwargs):
+        # (domain settings, domain) of the last WaveformGenerator domain built by
+        # _build_likelihood().
+        self._wfg_domain_cache = None
+        # Phase grids and (2, n_grid) 22-mode phasor bases for synthetic phase
+        # sampling, keyed by n_grid.
+        self._phase_grid_cache = {}
         super().__init__(**kwargs)
 
     @property
@@ -328,7 +335,13 @@ class Result(CoreResult):
                     f'Updating waveform generation delta_f from {wfg_domain_dict["delta_f"]} to {delta_f_new}.'
                 )
                 wfg_domain_dict["delta_f"] = delta_f_new
-        wfg_domain = build_domain(wfg_domain_dict)
+        # Reuse the domain from previous calls if the settings have not changed.
+        if (
+            self._wfg_domain_cache is None
+            or self._wfg_domain_cache[0] != wfg_domain_dict
+        ):
+            self._wfg_domain_cache = (wfg_domain_dict, build_domain(wfg_domain_dict))
+        wfg_domain = self._wfg_domain_cache[1]
 
         self.likelihood = StationaryGaussianGWLikelihood(
             wfg_kwargs=self.base_metadata["dataset_settings"]["waveform_generator"],
@@ -368,8 +381,8 @@ class Result(CoreResult):
               to transform as exp(2i*phase), in which case the likelihood is only exact
               if the waveform is fully dominated by the (2, 2) mode.
             * Build a synthetic conditional phase distribution based on this grid. We
-              use an interpolated prior distribution bilby.core.prior.Interped,
-              such that we can sample and also evaluate the log_prob. We add a constant
+              use an interpolated distribution (a batched equivalent of
+              bilby.core.prior.Interped), such that we can sample and also evaluate the log_prob. We add a constant
               background with weight self.synthetic_phase_kwargs to the kde to make
               sure that we keep a mass-covering property. With this, the importance
               sampling will yield exact results even when the synthetic phase conditional
@@ -389,6 +402,8 @@ class Result(CoreResult):
                 num_processes (optional)
                 n_grid
                 uniform_weight (optional)
+                device (optional), torch device for sampling from the synthetic
+                    phase distribution, e.g. "cuda" for large numbers of samples
         inverse : bool, default False
             Whether to apply instead the inverse transformation. This is used prior to
             calculating the log_prob. In inverse mode, the posterior probability over
@@ -413,13 +428,16 @@ class Result(CoreResult):
         # This builds on the Bilby approach to sampling the phase when using a
         # phase-marginalized likelihood.
 
-        # Restrict to samples that are within the prior.
+        # Restrict to samples that are within the prior. Work with a dict of column
+        # arrays, rather than copying the DataFrame.
         param_keys = [k for k, v in self.prior.items() if not isinstance(v, Constraint)]
-        theta = self.samples[param_keys]
+        theta = {k: self.samples[k].to_numpy() for k in param_keys}
+        num_samples = len(self.samples)
+        # PriorDict.ln_prob() already evaluates the constraints (and returns -inf
+        # where they are violated), so they need not be evaluated a second time.
         log_prior = self.prior.ln_prob(theta, axis=0)
-        constraints = self.prior.evaluate_constraints(theta)
-        np.putmask(log_prior, constraints == 0, -np.inf)
         within_prior = log_prior != -np.inf
+        theta_valid = {k: v[within_prior] for k, v in theta.items()}
 
         # Put a cap on the number of processes to avoid overhead:
         num_valid_samples = np.sum(within_prior)
@@ -437,36 +455,45 @@ class Result(CoreResult):
         if inverse:
             # We estimate the log_prob for given phases, so first save the evaluation
             # points.
-            sample_phase = theta["phase"].to_numpy(copy=True)
+            sample_phase = theta["phase"].copy()
 
         # For each sample, build the posterior over phase given the remaining parameters.
 
-        phases = np.linspace(0, 2 * np.pi, self.synthetic_phase_kwargs["n_grid"])
+        n_grid = self.synthetic_phase_kwargs["n_grid"]
+        if n_grid not in self._phase_grid_cache:
+            phases = np.linspace(0, 2 * np.pi, n_grid)
+            phasor_basis = np.stack((np.cos(2 * phases), -np.sin(2 * phases)))
+            self._phase_grid_cache[n_grid] = (phases, phasor_basis)
+        phases, phasor_basis = self._phase_grid_cache[n_grid]
         if approximation_22_mode:
             # For each sample, the un-normalized posterior depends only on (d | h(phase)):
             # The prior p(phase), and the inner products (h | h), and (d | d) only contribute
             # to the normalization. (We check above that p(phase) is constant.)
-            theta["phase"] = 0.0
+            theta_valid["phase"] = np.zeros(num_valid_samples)
             d_inner_h_complex = self.likelihood.d_inner_h_complex_multi(
-                theta.iloc[within_prior],
+                pd.DataFrame(theta_valid),
                 num_processes,
             )
 
-            # Evaluate the log posterior over the phase across the grid.
-            phasor = np.exp(2j * phases)
-            phase_log_posterior = np.outer(d_inner_h_complex, phasor).real
+            # Evaluate the log posterior over the phase across the grid,
+            # Re[(d | h) * exp(2i * phase)], as a single real matrix product.
+            phase_log_posterior = (
+                np.stack((d_inner_h_complex.real, d_inner_h_complex.imag), axis=1)
+                @ phasor_basis
+            )
         else:
             self.likelihood.phase_grid = phases
 
             phase_log_posterior = apply_func_with_multiprocessing(
                 self.likelihood.log_likelihood_phase_grid,
-                theta.iloc[within_prior],
+                pd.DataFrame(theta_valid),
                 num_processes=num_processes,
             )
 
-        phase_posterior = np.exp(
-            phase_log_posterior - np.amax(phase_log_posterior, axis=1, keepdims=True)
-        )
+        # Normalize each row by its maximum for numerical stability, and exponentiate
+        # in place, reusing the buffer of the log posterior.
+        phase_log_posterior -= np.amax(phase_log_posterior, axis=1, keepdims=True)
+        phase_posterior = np.exp(phase_log_posterior, out=phase_log_posterior)
         # Include a floor value to maintain mass coverage.
         phase_posterior += phase_posterior.mean(
             axis=-1, keepdims=True
@@ -480,12 +507,12 @@ class Result(CoreResult):
             new_phase, delta_log_prob = interpolated_sample_and_log_prob_multi(
                 phases,
                 phase_posterior,
-                num_processes,
+                device=self.synthetic_phase_kwargs.get("device"),
             )
 
-            phase_array = np.full(len(theta), 0.0)
+            phase_array = np.full(num_samples, 0.0)
             phase_array[within_prior] = new_phase
-            delta_log_prob_array = np.full(len(theta), -np.nan)
+            delta_log_prob_array = np.full(num_samples, -np.nan)
             delta_log_prob_array[within_prior] = delta_log_prob
 
             self.samples["phase"] = phase_array
@@ -505,14 +532,11 @@ class Result(CoreResult):
             #   (1) Evaluate the synthetic log prob for given phase points, and save it.
 
             log_prob = interpolated_log_prob_multi(
-                phases,
-                phase_posterior,
-                sample_phase[within_prior],
-                num_processes,
+                phases, phase_posterior, sample_phase[within_prior]
             )
 
             # Outside of prior, set log_prob to -np.nan.
-            log_prob_array = np.full(len(theta), -np.nan)
+            log_prob_array = np.full(num_samples, -np.nan)
             log_prob_array[within_prior] = log_prob
             self.samples["log_prob"] = log_prob_array
             del self.samples["phase"]
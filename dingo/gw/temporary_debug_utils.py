@@ -1,33 +1,59 @@
+import os
+
 import numpy as np
 
+from dingo.core.utils.trainutils import submit_background_write
+
+# Lazily imported modules, cached across calls of save_training_injection.
+_plt = None
+_build_domain = None
+_GWSignal = None
+
+
+def _lazy_imports():
+    global _plt, _build_domain, _GWSignal
+    if _plt is None:
+        import matplotlib
+
+        if not os.environ.get("DISPLAY"):
+            # no display available, skip loading interactive backends
+            matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+        from dingo.gw.domains import build_domain_from_model_metadata
+        from dingo.gw.injection import GWSignal
+
+        _plt, _build_domain, _GWSignal = plt, build_domain_from_model_metadata, GWSignal
+    return _plt, _build_domain, _GWSignal
+
+
 def save_training_injection(outname, pm, data, idx=0):
     """
     For debugging: extract a training injection. To be used inside train or test loop.
+    Saves the injection to outname and comparison plots to outname + "_abs.png" and
+    outname + "_complex.png".
     """
+    plt, build_domain_from_model_metadata, GWSignal = _lazy_imports()
     param_names = pm.metadata["train_settings"]["data"]["inference_parameters"]
     mean = pm.metadata["train_settings"]["data"]["standardization"]["mean"]
     std = pm.metadata["train_settings"]["data"]["standardization"]["std"]
-    params = {p: data[0][idx, idx_p] for idx_p, p in enumerate(param_names)}
-    params = {p: float(v * std[p] + mean[p]) for p, v in params.items()}
-
-    from dingo.gw.domains import build_domain_from_model_metadata
+    mean_arr = np.array([mean[p] for p in param_names])
+    std_arr = np.array([std[p] for p in param_names])
+    raw = np.asarray(data[0][idx, : len(param_names)], dtype=np.float64)
+    params = dict(zip(param_names, (raw * std_arr + mean_arr).tolist()))
 
     domain = build_domain_from_model_metadata(pm.metadata)
-    detectors = pm.metadata["train_settings"]["data"]["detectors"]
-    d = np.array(data[1])
-    asds = {
-        ifo: 1 / d[idx, idx_ifo, 2] * 1e-23 for idx_ifo, ifo in enumerate(detectors)
-    }
-    strains = {
-        ifo: (d[idx, idx_ifo, 0] + 1j * d[idx, idx_ifo, 1])
-        * (asds[ifo] * domain.noise_std)
-        for idx_ifo, ifo in enumerate(detectors)
-    }
+    detectors = tuple(pm.metadata["train_settings"]["data"]["detectors"])
+    noise_std = float(domain.noise_std)
+    # only convert the selected sample, without copying if possible
+    d = np.asarray(data[1][idx])  # shape (num_detectors, 3, num_bins)
+    asd_arr = 1e-23 / d[:, 2]
+    strain_arr = (d[:, 0] + 1j * d[:, 1]) * (asd_arr * noise_std)
+    asds = dict(zip(detectors, asd_arr))
+    strains = dict(zip(detectors, strain_arr))
 
     out_data = {"parameters": params, "asds": asds, "strains": strains}
-    np.save(outname, out_data)
-
-    from dingo.gw.injection import GWSignal
+    # write in the background, overlapping with the waveform generation below
+    saved = submit_background_write(np.save, outname, out_data)
 
     signal = GWSignal(
         pm.metadata["dataset_settings"]["waveform_generator"],
@@ -43,13 +69,17 @@ def save_training_injection(outname, pm, data, idx=0):
     sample_2 = signal.signal(params_2)
     sample_3 = signal.signal(params_3)
 
-    import matplotlib.pyplot as plt
+    saved.result()
 
-    plt.plot(np.abs(sample["waveform"]["H1"])[domain.min_idx:])
-    plt.plot(np.abs(strains["H1"]), lw=0.8)
-    plt.show()
+    fig1, ax1 = plt.subplots()
+    ax1.plot(np.abs(sample["waveform"]["H1"])[domain.min_idx:])
+    ax1.plot(np.abs(strains["H1"]), lw=0.8)
+    fig1.savefig(outname + "_abs.png")
+    plt.close(fig1)
 
-    plt.plot(sample["waveform"]["H1"][domain.min_idx:])
-    plt.plot(strains["H1"], lw=0.8)
-    # plt.plot(sample_2["waveform"]["H1"][domain.min_idx:])
-    plt.show()
\ No newline at end of file
+    fig2, ax2 = plt.subplots()
+    ax2.plot(sample["waveform"]["H1"][domain.min_idx:])
+    ax2.plot(strains["H1"], lw=0.8)
+    # ax2.plot(sample_2["waveform"]["H1"][domain.min_idx:])
+    fig2.savefig(outname + "_complex.png")
+    plt.close(fig2)
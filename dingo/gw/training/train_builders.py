@@ -50,6 +50,7 @@ def build_dataset(data_settings):
         precision="single",
         domain_update=domain_update,
         svd_size_update=data_settings.get("svd_size_update"),
+        lazy=data_settings.get("lazy_load", False),
     )
     return wfd
 
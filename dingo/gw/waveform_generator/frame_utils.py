@@ -115,17 +115,30 @@ def convert_J_to_L0_frame(hlm_J, p, wfg, spin_conversion_phase=None):
         p, wfg, spin_conversion_phase=spin_conversion_phase
     )
 
-    hlm_L0 = {}
+    # The rotation only mixes modes of the same l. For each l, the J frame modes are
+    # stacked, such that hlm_L0[(l, mp)] = sum_m wigner_D[m, mp] * hlm_J[(l, m)] is
+    # computed for all mp with a single matrix product.
+    modes_by_l = {}
     for (l, m), hlm in hlm_J.items():
-        for mp in range(-l, l + 1):
-            wigner_D = (
-                np.exp(1j * m * alpha_0)
-                * np.exp(1j * mp * gamma_0)
-                * lal.WignerdMatrix(l, m, mp, beta_0)
-            )
-            if (l, mp) not in hlm_L0:
-                hlm_L0[(l, mp)] = wigner_D * hlm
-            else:
-                hlm_L0[(l, mp)] += wigner_D * hlm
+        modes_by_l.setdefault(l, []).append((m, hlm))
+
+    hlm_L0 = {}
+    for l, modes in modes_by_l.items():
+        mp_values = range(-l, l + 1)
+        wigner_D = np.array(
+            [
+                [
+                    np.exp(1j * m * alpha_0)
+                    * np.exp(1j * mp * gamma_0)
+                    * lal.WignerdMatrix(l, m, mp, beta_0)
+                    for mp in mp_values
+                ]
+                for m, _ in modes
+            ]
+        )
+        hlm_J_stacked = np.stack([hlm for _, hlm in modes])
+        hlm_L0_stacked = wigner_D.T @ hlm_J_stacked
+        for mp, hlm in zip(mp_values, hlm_L0_stacked):
+            hlm_L0[(l, mp)] = hlm
 
     return hlm_L0
@@ -1,6 +1,8 @@
+from collections import OrderedDict
 from functools import partial
 from multiprocessing import Pool
 from math import isclose
+import os
 
 import numpy as np
 import astropy.units as u
@@ -20,6 +22,65 @@ import dingo.gw.waveform_generator.wfg_utils as wfg_utils
 import dingo.gw.waveform_generator.frame_utils as frame_utils
 from dingo.gw.domains import Domain, FrequencyDomain, TimeDomain
 
+_TIME_SHIFT_CACHE_SIZE = 8
+
+# Parameterization used for dingo datasets, for which the conversion to lal binary
+# black hole parameters only requires computing the component masses.
+_STANDARD_BBH_KEYS = frozenset(
+    (
+        "chirp_mass",
+        "mass_ratio",
+        "a_1",
+        "a_2",
+        "tilt_1",
+        "tilt_2",
+        "phi_12",
+        "phi_jl",
+        "theta_jn",
+        "phase",
+        "luminosity_distance",
+    )
+)
+# Further keys that the conversion leaves untouched.
+_PASSIVE_BBH_KEYS = frozenset(("geocent_time", "ra", "dec", "psi", "f_ref"))
+
+
+def _convert_to_lal_binary_black_hole_parameters(parameters: Dict) -> Dict:
+    """
+    Equivalent to bilby.gw.conversion.convert_to_lal_binary_black_hole_parameters(
+    parameters)[0], but with a fast path for the standard parameterization
+    (_STANDARD_BBH_KEYS), which avoids the generic checks for alternative mass,
+    spin and distance parameters. Returns a new dict.
+    """
+    keys = parameters.keys()
+    if _STANDARD_BBH_KEYS <= keys and keys <= _STANDARD_BBH_KEYS | _PASSIVE_BBH_KEYS:
+        p = dict(parameters)
+        mass_ratio = p["mass_ratio"]
+        p["total_mass"] = p["chirp_mass"] * (1 + mass_ratio) ** 1.2 / mass_ratio**0.6
+        p["mass_1"] = p["total_mass"] / (1 + mass_ratio)
+        p["mass_2"] = p["mass_1"] * mass_ratio
+        return p
+    p, _ = convert_to_lal_binary_black_hole_parameters(parameters)
+    return p
+
+
+def _any_abs_greater(threshold: float, *arrays: np.ndarray) -> bool:
+    """
+    Whether max(|a|) > threshold for any of the (contiguous, complex) arrays.
+
+    This avoids computing |a| over the full arrays: the largest real or imaginary
+    component x satisfies x <= |a| <= sqrt(2) * x, which decides the comparison
+    except in a narrow band around the threshold.
+    """
+    for a in arrays:
+        components = a.view(a.real.dtype)
+        x = max(components.max(), -components.min())
+        if x > threshold:
+            return True
+        if x > threshold / np.sqrt(2) and np.max(np.abs(a)) > threshold:
+            return True
+    return False
+
 
 class WaveformGenerator:
     """Generate polarizations using LALSimulation routines in the specified domain for a
@@ -75,28 +136,72 @@ class WaveformGenerator:
             raise ValueError("approximant should be a string, but got", approximant)
         else:
             self.approximant_str = approximant
+            self.mode_list = mode_list
             self.lal_params = None
             if "SEOBNRv5" not in approximant:
                 # This LAL function does not work with waveforms using the new interface. TODO: Improve the check.
                 self.approximant = LS.GetApproximantFromString(approximant)
+                # Whether lalsimulation implements the approximant natively in FD or
+                # TD. These are fixed for the approximant, so look them up only once.
+                self._is_fd_approximant = bool(
+                    LS.SimInspiralImplementedFDApproximants(self.approximant)
+                )
+                self._is_td_approximant = bool(
+                    LS.SimInspiralImplementedTDApproximants(self.approximant)
+                )
                 if mode_list is not None:
                     self.lal_params = self.setup_mode_array(mode_list)
 
-        if not issubclass(type(domain), Domain):
-            raise ValueError(
-                "domain should be an instance of a subclass of Domain, but got",
-                type(domain),
-            )
-        else:
-            self.domain = domain
+        self.domain = domain
 
         self.f_ref = f_ref
         self.f_start = f_start
 
         self.transform = transform
+        # Phase factors exp(-2 pi i f dt) for undoing the LAL time shift, see
+        # _get_time_shift().
+        self._time_shift_cache = OrderedDict()
+        self._nan_polarization = None
+        self._fd_domain_parameters = None
         self._spin_conversion_phase = None
         self.spin_conversion_phase = spin_conversion_phase
 
+    def __getstate__(self):
+        # The lal_params LALDict cannot be pickled (e.g., when sending the generator
+        # to worker processes), so it is rebuilt from the mode_list when unpickling.
+        state = self.__dict__.copy()
+        state["lal_params"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self.mode_list is not None and "SEOBNRv5" not in self.approximant_str:
+            self.lal_params = self.setup_mode_array(self.mode_list)
+
+    @property
+    def domain(self):
+        return self._domain
+
+    @domain.setter
+    def domain(self, value):
+        if not issubclass(type(value), Domain):
+            raise ValueError(
+                "domain should be an instance of a subclass of Domain, but got",
+                type(value),
+            )
+        self._domain = value
+        # Resolve the domain-dependent waveform generation method and lalsimulation
+        # function once, rather than for every waveform.
+        if isinstance(value, FrequencyDomain):
+            self._wf_generator = self.generate_FD_waveform
+            self._lal_target_function = "SimInspiralFD"
+        elif isinstance(value, TimeDomain):
+            self._wf_generator = self.generate_TD_waveform
+            self._lal_target_function = "SimInspiralTD"
+        else:
+            self._wf_generator = None
+            self._lal_target_function = None
+
     @property
     def spin_conversion_phase(self):
         return self._spin_conversion_phase
@@ -165,45 +270,99 @@ class WaveformGenerator:
         """
         if not isinstance(parameters, dict):
             raise ValueError("parameters should be a dictionary, but got", parameters)
-        elif not isinstance(list(parameters.values())[0], float):
+        elif not isinstance(next(iter(parameters.values())), float):
             raise ValueError("parameters dictionary must contain floats", parameters)
 
-        # Include reference frequency with the parameters. Copy the dict first for safety.
-        parameters = parameters.copy()
-        parameters["f_ref"] = self.f_ref
-
-        parameters_generator = self._convert_parameters(parameters, self.lal_params)
+        # The reference frequency is included with the parameters during conversion,
+        # which works on a copy, such that the input dict is not modified.
+        parameters_generator = self._convert_parameters(
+            parameters, self.lal_params, f_ref=self.f_ref
+        )
 
         # Generate GW polarizations
-        if isinstance(self.domain, FrequencyDomain):
-            wf_generator = self.generate_FD_waveform
-        elif isinstance(self.domain, TimeDomain):
-            wf_generator = self.generate_TD_waveform
-        else:
+        wf_generator = self._wf_generator
+        if wf_generator is None:
             raise ValueError(f"Unsupported domain type {type(self.domain)}.")
 
         try:
             wf_dict = wf_generator(parameters_generator)
-        except Exception as e:
-            if not catch_waveform_errors:
+        except RuntimeError as e:
+            # The lal SWIG bindings raise XLAL errors as RuntimeError. Of these, only
+            # input domain errors (EDOM) are caught, other errors are raised.
+            EDOM = "Input domain error" in str(e)
+            if not (catch_waveform_errors and EDOM):
                 raise
-            else:
-                EDOM = e.args[0] == "Internal function call failed: Input domain error"
-                if EDOM:
-                    warnings.warn(
-                        f"Evaluating the waveform failed with error: {e}\n"
-                        f"The parameters were {parameters_generator}\n"
-                    )
-                    pol_nan = np.ones(len(self.domain), dtype=complex) * np.nan
-                    wf_dict = {"h_plus": pol_nan, "h_cross": pol_nan}
-                else:
-                    raise
+            warnings.warn(
+                f"Evaluating the waveform failed with error: {e}\n"
+                f"The parameters were {parameters_generator}\n"
+            )
+            pol_nan = self._get_nan_polarization()
+            wf_dict = {"h_plus": pol_nan, "h_cross": pol_nan}
 
         if self.transform is not None:
             return self.transform(wf_dict)
         else:
             return wf_dict
 
+    def _get_fd_domain_parameters(self) -> Tuple[float, float, float, float]:
+        """
+        Return (delta_f, f_min, f_max, delta_t) as floats, as passed to the
+        lalsimulation waveform functions for a FrequencyDomain. Here, f_min is
+        self.f_start if set, and delta_t is the corresponding time resolution for TD
+        waveforms.
+
+        The result is cached. Updates of the domain are detected through its array of
+        sample frequencies, which the domain rebuilds after any change of its range.
+        """
+        frequencies = self.domain()
+        cache = self._fd_domain_parameters
+        if cache is None or cache[0] is not frequencies or cache[1] != self.f_start:
+            if self.f_start is not None:
+                f_min = self.f_start
+            else:
+                f_min = self.domain.f_min
+            domain_parameters = (
+                float(self.domain.delta_f),
+                float(f_min),
+                float(self.domain.f_max),
+                0.5 / float(self.domain.f_max),
+            )
+            cache = (frequencies, self.f_start, domain_parameters)
+            self._fd_domain_parameters = cache
+        return cache[2]
+
+    def _get_nan_polarization(self) -> np.ndarray:
+        """
+        Return a read-only NaN array of the length of the domain, which is returned
+        in place of the polarizations when waveform generation fails. It is created
+        once and then shared.
+        """
+        if self._nan_polarization is None or len(self._nan_polarization) != len(
+            self.domain
+        ):
+            self._nan_polarization = np.full(len(self.domain), np.nan, dtype=complex)
+            self._nan_polarization.flags.writeable = False
+        return self._nan_polarization
+
+    def _get_time_shift(self, dt: float, frequency_array: np.ndarray) -> np.ndarray:
+        """
+        Return exp(-2 pi i f dt) on frequency_array. The time shift dt applied by LAL
+        takes only few distinct values for a given domain, so the results are cached
+        (up to _TIME_SHIFT_CACHE_SIZE of them, least recently used are evicted). The
+        returned array is read-only.
+        """
+        key = (dt, self.domain.delta_f, len(frequency_array))
+        time_shift = self._time_shift_cache.get(key)
+        if time_shift is None:
+            time_shift = np.exp(-1j * 2 * np.pi * dt * frequency_array)
+            time_shift.flags.writeable = False
+            self._time_shift_cache[key] = time_shift
+            if len(self._time_shift_cache) > _TIME_SHIFT_CACHE_SIZE:
+                self._time_shift_cache.popitem(last=False)
+        else:
+            self._time_shift_cache.move_to_end(key)
+        return time_shift
+
     def _convert_to_scalar(self, x: Union[np.ndarray, float]) -> Number:
         """
         Convert a single element array to a number.
@@ -227,11 +386,35 @@ class WaveformGenerator:
         else:
             return x
 
+    def _convert_to_floats(self, xs: Tuple) -> List[float]:
+        """
+        Convert a sequence of numbers or single element arrays to a list of floats.
+        This uses a single numpy conversion, rather than converting each element.
+
+        Parameters
+        ----------
+        xs:
+            Sequence of numbers or arrays
+
+        Returns
+        -------
+        A list of floats
+        """
+        try:
+            values = np.asarray(xs, dtype=float)
+        except ValueError:
+            # Inhomogeneous input, e.g., a mixture of numbers and arrays.
+            return [float(self._convert_to_scalar(x)) for x in xs]
+        if values.size != len(xs):
+            raise ValueError(f"Expected arrays of length one, but got {xs}")
+        return values.ravel().tolist()
+
     def _convert_parameters(
         self,
         parameter_dict: Dict,
         lal_params=None,
         lal_target_function=None,
+        f_ref: float = None,
     ) -> Tuple:
         """Convert to lal source frame parameters
 
@@ -251,6 +434,8 @@ class WaveformGenerator:
                 - SimInspiralTD (Also works for SimInspiralChooseTDWaveform)
                 - SimInspiralChooseFDModes
                 - SimInspiralChooseTDModes
+        f_ref: float = None
+            If provided, reference frequency to use instead of parameter_dict["f_ref"].
         Returns
         -------
         lal_parameter_tuple:
@@ -258,11 +443,8 @@ class WaveformGenerator:
         """
         # check that the lal_target_function is valid
         if lal_target_function is None:
-            if isinstance(self.domain, FrequencyDomain):
-                lal_target_function = "SimInspiralFD"
-            elif isinstance(self.domain, TimeDomain):
-                lal_target_function = "SimInspiralTD"
-            else:
+            lal_target_function = self._lal_target_function
+            if lal_target_function is None:
                 raise ValueError(f"Unsupported domain type {type(self.domain)}.")
         if lal_target_function not in [
             "SimInspiralFD",
@@ -275,56 +457,50 @@ class WaveformGenerator:
                 f"Unsupported lalsimulation waveform function {lal_target_function}."
             )
 
-        # Transform mass, spin, and distance parameters
-        p, _ = convert_to_lal_binary_black_hole_parameters(parameter_dict)
+        # Transform mass, spin, and distance parameters. This returns a new dict.
+        p = _convert_to_lal_binary_black_hole_parameters(parameter_dict)
+        if f_ref is not None:
+            p["f_ref"] = f_ref
 
         # Convert to SI units
         p["mass_1"] *= lal.MSUN_SI
         p["mass_2"] *= lal.MSUN_SI
         p["luminosity_distance"] *= 1e6 * lal.PC_SI
 
-        # Transform to lal source frame: iota and Cartesian spin components
-        param_keys_in = (
-            "theta_jn",
-            "phi_jl",
-            "tilt_1",
-            "tilt_2",
-            "phi_12",
-            "a_1",
-            "a_2",
-            "mass_1",
-            "mass_2",
-            "f_ref",
-            "phase",
+        # Transform to lal source frame: iota and Cartesian spin components.
+        # If spin_conversion_phase is set, use this as fixed phiRef when computing the
+        # cartesian spins instead of using the phase parameter.
+        phi_ref = self._spin_conversion_phase
+        if phi_ref is None:
+            phi_ref = p["phase"]
+        iota_and_cart_spins = bilby_to_lalsimulation_spins(
+            p["theta_jn"],
+            p["phi_jl"],
+            p["tilt_1"],
+            p["tilt_2"],
+            p["phi_12"],
+            p["a_1"],
+            p["a_2"],
+            p["mass_1"],
+            p["mass_2"],
+            p["f_ref"],
+            phi_ref,
+        )
+        iota, s1x, s1y, s1z, s2x, s2y, s2z = self._convert_to_floats(
+            iota_and_cart_spins
         )
-        param_values_in = [p[k] for k in param_keys_in]
-        # if spin_conversion_phase is set, use this as fixed phiRef when computing the
-        # cartesian spins instead of using the phase parameter
-        if self.spin_conversion_phase is not None:
-            param_values_in[-1] = self.spin_conversion_phase
-        iota_and_cart_spins = bilby_to_lalsimulation_spins(*param_values_in)
-        iota, s1x, s1y, s1z, s2x, s2y, s2z = [
-            float(self._convert_to_scalar(x)) for x in iota_and_cart_spins
-        ]
 
         # Construct argument list for FD and TD lal waveform generator wrappers
-        spins_cartesian = s1x, s1y, s1z, s2x, s2y, s2z
-        masses = (p["mass_1"], p["mass_2"])
-        r = p["luminosity_distance"]
-        phase = p["phase"]
-        ecc_params = (0.0, 0.0, 0.0)  # longAscNodes, eccentricity, meanPerAno
+        # All parameters are converted to float, as required by lalsimulation.
+        m1 = float(p["mass_1"])
+        m2 = float(p["mass_2"])
+        r = float(p["luminosity_distance"])
+        phase = float(p["phase"])
 
         # Get domain parameters
-        f_ref = p["f_ref"]
+        f_ref = float(p["f_ref"])
         if isinstance(self.domain, FrequencyDomain):
-            delta_f = self.domain.delta_f
-            f_max = self.domain.f_max
-            if self.f_start is not None:
-                f_min = self.f_start
-            else:
-                f_min = self.domain.f_min
-            # parameters needed for TD waveforms
-            delta_t = 0.5 / self.domain.f_max
+            delta_f, f_min, f_max, delta_t = self._get_fd_domain_parameters()
         elif isinstance(self.domain, TimeDomain):
             raise NotImplementedError("Time domain not supported yet.")
             # FIXME: compute f_min from duration or specify it if SimInspiralTD
@@ -337,6 +513,8 @@ class WaveformGenerator:
         else:
             raise ValueError(f"Unsupported domain type {type(self.domain)}.")
 
+        # The argument tuples are written out in full, which avoids building them from
+        # intermediate tuples.
         if lal_target_function == "SimInspiralFD":
             # LS.SimInspiralFD takes parameters:
             #   m1, m2, S1x, S1y, S1z, S2x, S2y, S2z,
@@ -344,15 +522,27 @@ class WaveformGenerator:
             #   longAscNodes, eccentricity, meanPerAno,
             #   deltaF, f_min, f_max, f_ref,
             #   lal_params, approximant
-            domain_pars = (delta_f, f_min, f_max, f_ref)
-            domain_pars = tuple(float(p) for p in domain_pars)
             lal_parameter_tuple = (
-                masses
-                + spins_cartesian
-                + (r, iota, phase)
-                + ecc_params
-                + domain_pars
-                + (lal_params, self.approximant)
+                m1,
+                m2,
+                s1x,
+                s1y,
+                s1z,
+                s2x,
+                s2y,
+                s2z,
+                r,
+                iota,
+                phase,
+                0.0,
+                0.0,
+                0.0,
+                delta_f,
+                f_min,
+                f_max,
+                f_ref,
+                lal_params,
+                self.approximant,
             )
 
         elif lal_target_function == "SimInspiralTD":
@@ -362,25 +552,51 @@ class WaveformGenerator:
             #   longAscNodes, eccentricity, meanPerAno,
             #   delta_t, f_min, f_ref
             #   lal_params, approximant
-            domain_pars = (delta_t, f_min, f_ref)
-            domain_pars = tuple(float(p) for p in domain_pars)
             lal_parameter_tuple = (
-                masses
-                + spins_cartesian
-                + (r, iota, phase)
-                + ecc_params
-                + domain_pars
-                + (lal_params, self.approximant)
+                m1,
+                m2,
+                s1x,
+                s1y,
+                s1z,
+                s2x,
+                s2y,
+                s2z,
+                r,
+                iota,
+                phase,
+                0.0,
+                0.0,
+                0.0,
+                delta_t,
+                f_min,
+                f_ref,
+                lal_params,
+                self.approximant,
             )
         elif lal_target_function == "SimInspiralChooseFDModes":
-            domain_pars = (delta_f, f_min, f_max, f_ref)
-            domain_pars = tuple(float(p) for p in domain_pars)
+            # LS.SimInspiralChooseFDModes takes parameters:
+            #   m1, m2, S1x, S1y, S1z, S2x, S2y, S2z,
+            #   deltaF, f_min, f_max, f_ref,
+            #   phiRef, distance, inclination,
+            #   lal_params, approximant
             lal_parameter_tuple = (
-                masses
-                + spins_cartesian
-                + domain_pars
-                + (phase, r, iota)
-                + (lal_params, self.approximant)
+                m1,
+                m2,
+                s1x,
+                s1y,
+                s1z,
+                s2x,
+                s2y,
+                s2z,
+                delta_f,
+                f_min,
+                f_max,
+                f_ref,
+                phase,
+                r,
+                iota,
+                lal_params,
+                self.approximant,
             )
 
         elif (
@@ -388,7 +604,18 @@ class WaveformGenerator:
             == "SimIMRPhenomXPCalculateModelParametersFromSourceFrame"
         ):
             lal_parameter_tuple = (
-                masses + (f_ref,) + (phase, iota) + spins_cartesian + (lal_params,)
+                m1,
+                m2,
+                f_ref,
+                phase,
+                iota,
+                s1x,
+                s1y,
+                s1z,
+                s2x,
+                s2y,
+                s2z,
+                lal_params,
             )
 
         elif lal_target_function == "SimInspiralChooseTDModes":
@@ -398,20 +625,25 @@ class WaveformGenerator:
             #   f_min, f_ref
             #   distance,
             #   lal_params, l_max, approximant
-            domain_pars = (delta_t, f_min, f_ref)
-            domain_pars = tuple(float(p) for p in domain_pars)
             if "l_max" not in parameter_dict:
                 l_max = 5  # hard code l_max for now
             lal_parameter_tuple = (
-                (
-                    0.0,
-                    domain_pars[0],
-                )  # domain_pars[0] = delta_t
-                + masses
-                + spins_cartesian
-                + domain_pars[1:]  # domain_pars[1:] = f_min, f_ref
-                + (r,)
-                + (lal_params, l_max, self.approximant)
+                0.0,
+                delta_t,
+                m1,
+                m2,
+                s1x,
+                s1y,
+                s1z,
+                s2x,
+                s2y,
+                s2z,
+                f_min,
+                f_ref,
+                r,
+                lal_params,
+                l_max,
+                self.approximant,
             )
             # also pass iota, since this is needed for recombination of the modes
             lal_parameter_tuple = (lal_parameter_tuple, iota)
@@ -475,23 +707,21 @@ class WaveformGenerator:
         #   deltaF, f_min, f_max, f_ref,
         #   lal_params, approximant
 
-        # Sanity check types of arguments
-        check_floats = all(map(lambda x: isinstance(x, float), parameters_lal[:18]))
-        check_int = isinstance(parameters_lal[19], int)
-        # parameters_lal[18]  # lal_params could be None or a LALDict
-        if not (check_floats and check_int):
-            raise ValueError(
-                "SimInspiralFD received invalid argument(s)", parameters_lal
-            )
+        # The argument types are not checked here: _convert_parameters() constructs
+        # parameters_lal[:18] as floats, parameters_lal[18] (lal_params) is None or a
+        # LALDict, and parameters_lal[19] is the approximant, an int.
 
         # Depending on whether the domain is uniform or non-uniform call the appropriate wf generator
         hp, hc = LS.SimInspiralFD(*parameters_lal)
+        # Each access of .data.data goes through the SWIG wrappers, so the data arrays
+        # (views of the lal series) are looked up once.
+        hp_data, hc_data = hp.data.data, hc.data.data
         # The check below filters for unphysical waveforms:
         # For IMRPhenomXPHM, the LS.SimInspiralFD result is numerically instable
         # for rare parameter configurations (~1 in 1M), leading to bins with very large
         # numbers if multibanding is used. If that happens, turn off multibanding to
         # fix this.
-        if max(np.max(np.abs(hp.data.data)), np.max(np.abs(hc.data.data))) > 1e-20:
+        if _any_abs_greater(1e-20, hp_data, hc_data):
             print(
                 f"Generation with parameters {parameters_lal} likely numerically "
                 f"unstable due to multibanding, turn off multibanding."
@@ -504,7 +734,8 @@ class WaveformGenerator:
             hp, hc = LS.SimInspiralFD(
                 *parameters_lal[:-2], lal_dict, parameters_lal[-1]
             )
-            if max(np.max(np.abs(hp.data.data)), np.max(np.abs(hc.data.data))) > 1e-20:
+            hp_data, hc_data = hp.data.data, hc.data.data
+            if _any_abs_greater(1e-20, hp_data, hc_data):
                 print(
                     f"Warning: turning off multibanding for parameters {parameters_lal}"
                     f"likely numerically might not have fixed it, check manually."
@@ -519,25 +750,26 @@ class WaveformGenerator:
             )
 
         frequency_array = self.domain()
-        h_plus = np.zeros_like(frequency_array, dtype=complex)
-        h_cross = np.zeros_like(frequency_array, dtype=complex)
         # Ensure that length of wf agrees with length of domain. Enforce by truncating frequencies beyond f_max
-        if len(hp.data.data) > len(frequency_array):
+        if len(hp_data) > len(frequency_array):
             warnings.warn(
                 "LALsimulation waveform longer than domain's `frequency_array`"
-                f"({len(hp.data.data)} vs {len(frequency_array)}). Truncating lalsim array."
+                f"({len(hp_data)} vs {len(frequency_array)}). Truncating lalsim array."
             )
-            h_plus = hp.data.data[: len(h_plus)]
-            h_cross = hc.data.data[: len(h_cross)]
-        else:
-            h_plus[: len(hp.data.data)] = hp.data.data
-            h_cross[: len(hc.data.data)] = hc.data.data
-
-        # Undo the time shift done in SimInspiralFD to the waveform
+        n = min(len(hp_data), len(frequency_array))
+        # The polarizations are copied into the rows of a single new array (callers
+        # keep them). Only the bins not covered by the LAL waveform need to be zeroed.
+        h = np.empty((2, len(frequency_array)), dtype=complex)
+        h[0, :n] = hp_data[:n]
+        h[1, :n] = hc_data[:n]
+        h[:, n:] = 0.0
+
+        # Undo the time shift done in SimInspiralFD to the waveform. Both
+        # polarizations are shifted in a single pass, skipping the zero padding.
         dt = 1 / hp.deltaF + (hp.epoch.gpsSeconds + hp.epoch.gpsNanoSeconds * 1e-9)
-        time_shift = np.exp(-1j * 2 * np.pi * dt * frequency_array)
-        h_plus *= time_shift
-        h_cross *= time_shift
+        time_shift = self._get_time_shift(dt, frequency_array)
+        np.multiply(h[:, :n], time_shift[:n], out=h[:, :n])
+        h_plus, h_cross = h
         pol_dict = {"h_plus": h_plus, "h_cross": h_cross}
         return pol_dict
 
@@ -603,12 +835,12 @@ class WaveformGenerator:
         """
         if not isinstance(parameters, dict):
             raise ValueError("parameters should be a dictionary, but got", parameters)
-        elif not isinstance(list(parameters.values())[0], float):
+        elif not isinstance(next(iter(parameters.values())), float):
             raise ValueError("parameters dictionary must contain floats", parameters)
 
         if isinstance(self.domain, FrequencyDomain):
             # Generate FD modes in for frequencies [-f_max, ..., 0, ..., f_max].
-            if LS.SimInspiralImplementedFDApproximants(self.approximant):
+            if self._is_fd_approximant:
                 # Step 1: generate waveform modes in L0 frame in native domain of
                 # approximant (here: FD)
                 hlm_fd, iota = self.generate_FD_modes_LO(parameters)
@@ -617,7 +849,7 @@ class WaveformGenerator:
                 # Not required here, as approximant domain and target domain are both FD.
 
             else:
-                assert LS.SimInspiralImplementedTDApproximants(self.approximant)
+                assert self._is_td_approximant
                 # Step 1: generate waveform modes in L0 frame in native domain of
                 # approximant (here: TD)
                 hlm_td, iota = self.generate_TD_modes_L0(parameters)
@@ -668,8 +900,7 @@ class WaveformGenerator:
             iota = parameters_lal_fd_modes[14]
             hlm_fd = LS.SimInspiralChooseFDModes(*parameters_lal_fd_modes)
             # unpack linked list, convert lal objects to arrays
-            hlm_fd = wfg_utils.linked_list_modes_to_dict_modes(hlm_fd)
-            hlm_fd = {k: v.data.data for k, v in hlm_fd.items()}
+            hlm_fd = wfg_utils.linked_list_modes_to_dict_modes(hlm_fd, as_arrays=True)
             # For the waveform models considered here (e.g., IMRPhenomXPHM), the modes
             # are returned in the J frame (where the observer is at inclination=theta_JN,
             # azimuth=0). In this frame, the dependence on the reference phase enters
@@ -722,7 +953,7 @@ class WaveformGenerator:
             return wfg_utils.linked_list_modes_to_dict_modes(hlm_td), iota
         else:
             raise NotImplementedError(
-                f"Approximant {LS.GetApproximantFromString(self.approximant)} not "
+                f"Approximant {self.approximant_str} not "
                 f"implemented. When adding this approximant to this method, make sure "
                 f"the the output dict hlm_td contains the TD modes in the *L0 frame*. "
                 f"In particular, adding an approximant that is implemented in the same "
@@ -784,57 +1015,63 @@ class NewInterfaceWaveformGenerator(WaveformGenerator):
         globals()['gws_wfm'] = waveform
         globals()["new_interface_get_waveform_generator"] = gwsignal_get_waveform_generator 
 
+        # gwsignal generator for the approximant, see _get_generator().
+        self._generator = None
+
+    def __getstate__(self):
+        # The generator is recreated when needed after unpickling.
+        state = super().__getstate__()
+        state["_generator"] = None
+        return state
 
-        self.mode_list = kwargs.get("mode_list", None)
+    def _get_generator(self):
+        """
+        Return the gwsignal generator for the approximant. Since the approximant is
+        fixed, it is created only once, rather than for every waveform.
+        """
+        if self._generator is None:
+            self._generator = new_interface_get_waveform_generator(self.approximant_str)
+        return self._generator
 
     def _convert_parameters(
         self,
         parameter_dict: Dict,
         lal_params=None,
+        f_ref: float = None,
     ):
-        # Transform mass, spin, and distance parameters
-        p, _ = convert_to_lal_binary_black_hole_parameters(parameter_dict)
-
-        # Transform to lal source frame: iota and Cartesian spin components
-        param_keys_in = (
-            "theta_jn",
-            "phi_jl",
-            "tilt_1",
-            "tilt_2",
-            "phi_12",
-            "a_1",
-            "a_2",
-            "mass_1",
-            "mass_2",
-            "f_ref",
-            "phase",
-        )
-        param_values_in = [p[k] for k in param_keys_in]
-
+        # Transform mass, spin, and distance parameters. This returns a new dict.
+        p = _convert_to_lal_binary_black_hole_parameters(parameter_dict)
+        if f_ref is not None:
+            p["f_ref"] = f_ref
+
+        # Transform to lal source frame: iota and Cartesian spin components.
+        # If spin_conversion_phase is set, use this as fixed phiRef when computing the
+        # cartesian spins instead of using the phase parameter.
+        phi_ref = self._spin_conversion_phase
+        if phi_ref is None:
+            phi_ref = p["phase"]
         # Masses for spin conversion must be in SI units. However, for waveform generation, they must remain in solar
         # masses due to sensitive dependence of SEOBNRv5 waveforms to small changes in the mass. Hence, we only convert
         # units here.
-        param_values_in[7] *= lal.MSUN_SI
-        param_values_in[8] *= lal.MSUN_SI
-
-        # if spin_conversion_phase is set, use this as fixed phiRef when computing the
-        # cartesian spins instead of using the phase parameter
-        if self.spin_conversion_phase is not None:
-            param_values_in[-1] = self.spin_conversion_phase
-        iota_and_cart_spins = bilby_to_lalsimulation_spins(*param_values_in)
-        iota, s1x, s1y, s1z, s2x, s2y, s2z = [
-            float(self._convert_to_scalar(x)) for x in iota_and_cart_spins
-        ]
+        iota_and_cart_spins = bilby_to_lalsimulation_spins(
+            p["theta_jn"],
+            p["phi_jl"],
+            p["tilt_1"],
+            p["tilt_2"],
+            p["phi_12"],
+            p["a_1"],
+            p["a_2"],
+            p["mass_1"] * lal.MSUN_SI,
+            p["mass_2"] * lal.MSUN_SI,
+            p["f_ref"],
+            phi_ref,
+        )
+        iota, s1x, s1y, s1z, s2x, s2y, s2z = self._convert_to_floats(
+            iota_and_cart_spins
+        )
 
         f_ref = p["f_ref"]
-        delta_f = self.domain.delta_f
-        f_max = self.domain.f_max
-        if self.f_start is not None:
-            f_min = self.f_start
-        else:
-            f_min = self.domain.f_min
-        # parameters needed for TD waveforms
-        delta_t = 0.5 / self.domain.f_max
+        delta_f, f_min, f_max, delta_t = self._get_fd_domain_parameters()
 
         params_gwsignal = {
             "mass1": p["mass_1"] * u.solMass,
@@ -917,7 +1154,7 @@ class NewInterfaceWaveformGenerator(WaveformGenerator):
         #    )
 
         # Depending on whether the domain is uniform or non-uniform call the appropriate wf generator
-        generator = new_interface_get_waveform_generator(self.approximant_str)
+        generator = self._get_generator()
         hpc = gws_wfm.GenerateFDWaveform(parameters_gwsignal, generator)
         hp = hpc.hp
         hc = hpc.hc
@@ -947,9 +1184,9 @@ class NewInterfaceWaveformGenerator(WaveformGenerator):
 
         # Undo the time shift done in SimInspiralFD to the waveform
         dt = 1 / hp.df.value + hp.epoch.value
-        time_shift = np.exp(-1j * 2 * np.pi * dt * frequency_array)
-        h_plus *= time_shift
-        h_cross *= time_shift
+        time_shift = self._get_time_shift(dt, frequency_array)
+        np.multiply(h_plus, time_shift, out=h_plus)
+        np.multiply(h_cross, time_shift, out=h_cross)
         pol_dict = {"h_plus": h_plus, "h_cross": h_cross}
         return pol_dict
 
@@ -1015,10 +1252,10 @@ class NewInterfaceWaveformGenerator(WaveformGenerator):
         """
         if not isinstance(parameters, dict):
             raise ValueError("parameters should be a dictionary, but got", parameters)
-        elif not isinstance(list(parameters.values())[0], float):
+        elif not isinstance(next(iter(parameters.values())), float):
             raise ValueError("parameters dictionary must contain floats", parameters)
 
-        generator = new_interface_get_waveform_generator(self.approximant_str)
+        generator = self._get_generator()
         if isinstance(self.domain, FrequencyDomain):
             # Generate FD modes in for frequencies [-f_max, ..., 0, ..., f_max].
             if generator.domain == "freq":
@@ -1090,26 +1327,15 @@ class NewInterfaceWaveformGenerator(WaveformGenerator):
                 {**parameters, "f_ref": self.f_ref}
             )
             iota = parameters_gwsignal["inclination"]
-            generator = new_interface_get_waveform_generator(self.approximant_str)
+            generator = self._get_generator()
             hlm_fd = gws_wfm.GenerateFDModes(parameters_gwsignal, generator)
-            # unpack linked list, convert lal objects to arrays
-
-            hlms_lal = {}
-            for key, value in hlm_fd.items():
-                if type(key) != str:
-                    hlm_lal = lal.CreateCOMPLEX16TimeSeries(
-                        "hplus",
-                        value.epoch.value,
-                        0,
-                        value.dt.value,
-                        lal.DimensionlessUnit,
-                        len(value),
-                    )
-                    hlm_lal.data.data = value.value
-                    hlms_lal[key] = hlm_lal
-
-            hlm_fd = wfg_utils.linked_list_modes_to_dict_modes(hlms_lal)
-            hlm_fd = {k: v.data.data for k, v in hlm_fd.items()}
+            # gwsignal returns a dict of modes (and further str keys), so there is no
+            # linked list to unpack. Copy the data of the modes to complex arrays.
+            hlm_fd = {
+                key: np.array(value.value, dtype=complex)
+                for key, value in hlm_fd.items()
+                if type(key) != str
+            }
             # For the waveform models considered here (e.g., IMRPhenomXPHM), the modes
             # are returned in the J frame (where the observer is at inclination=theta_JN,
             # azimuth=0). In this frame, the dependence on the reference phase enters
@@ -1124,7 +1350,7 @@ class NewInterfaceWaveformGenerator(WaveformGenerator):
             return hlm_fd, iota
         else:
             raise NotImplementedError(
-                f"Approximant {LS.GetApproximantFromString(self.approximant)} not "
+                f"Approximant {self.approximant_str} not "
                 f"implemented. When adding this approximant to this method, make sure "
                 f"the the output dict hlm_td contains the TD modes in the *L0 frame*. "
                 f"In particular, adding an approximant that is implemented in the same "
@@ -1158,7 +1384,7 @@ class NewInterfaceWaveformGenerator(WaveformGenerator):
             {**parameters, "f_ref": self.f_ref}
         )
 
-        generator = new_interface_get_waveform_generator(self.approximant_str)
+        generator = self._get_generator()
         hlm_td = gws_wfm.GenerateTDModes(parameters_gwsignal, generator)
         hlms_lal = {}
 
@@ -1219,7 +1445,7 @@ class NewInterfaceWaveformGenerator(WaveformGenerator):
         params = parameters_gwsignal.copy()
         params["f22_start"] = new_f_start * u.Hz
 
-        generator = new_interface_get_waveform_generator(self.approximant_str)
+        generator = self._get_generator()
         hlm_td = gws_wfm.GenerateTDModes(params, generator)
         hlms_lal = {}
 
@@ -1258,7 +1484,7 @@ class NewInterfaceWaveformGenerator(WaveformGenerator):
         #   deltaT, f_min, f_ref
         #   lal_params, approximant
 
-        generator = new_interface_get_waveform_generator(self.approximant_str)
+        generator = self._get_generator()
         hpc = gws_wfm.GenerateTDWaveform(parameters_gwsignal, generator)
 
         h_plus = hpc.hp.value
@@ -1296,31 +1522,34 @@ def SEOBNRv4PHM_maximum_starting_frequency(
     return f_max_Hz
 
 
-def generate_waveforms_task_func(
-    args: Tuple, waveform_generator: WaveformGenerator
-) -> Dict[str, np.ndarray]:
+def _generate_waveforms_task_func_indexed(
+    task: Tuple[int, Dict[str, float]], waveform_generator: WaveformGenerator
+) -> Tuple[int, Dict[str, np.ndarray]]:
     """
     Picklable wrapper function for parallel waveform generation.
 
     Parameters
     ----------
-    args:
-        A tuple of (index, pandas.core.series.Series)
+    task:
+        Tuple (idx, parameters), where idx is the index of the sample and
+        parameters is a dictionary of parameter names and scalar values
     waveform_generator:
         A WaveformGenerator instance
 
     Returns
     -------
-    The generated waveform polarization dictionary
+    Tuple (idx, polarizations) of the index and the generated waveform polarization
+    dictionary. The index is returned such that tasks can complete in any order.
     """
-    parameters = args[1].to_dict()
-    return waveform_generator.generate_hplus_hcross(parameters)
+    idx, parameters = task
+    return idx, waveform_generator.generate_hplus_hcross(parameters)
 
 
 def generate_waveforms_parallel(
     waveform_generator: WaveformGenerator,
     parameter_samples: pd.DataFrame,
     pool: Pool = None,
+    num_processes: int = None,
 ) -> Dict[str, np.ndarray]:
     """Generate a waveform dataset, optionally in parallel.
 
@@ -1332,6 +1561,9 @@ def generate_waveforms_parallel(
         Intrinsic parameter samples
     pool: multiprocessing.Pool
         Optional pool of workers for parallel generation
+    num_processes: int
+        Number of processes in pool, used to determine the number of tasks sent to a
+        worker at a time. Defaults to os.cpu_count(), the default size of a Pool.
 
     Returns
     -------
@@ -1341,18 +1573,41 @@ def generate_waveforms_parallel(
     # logger.info('Generating waveform polarizations ...')
 
     task_func = partial(
-        generate_waveforms_task_func, waveform_generator=waveform_generator
+        _generate_waveforms_task_func_indexed, waveform_generator=waveform_generator
+    )
+    # Plain dicts are much cheaper to construct and to send to the workers than the
+    # rows of the DataFrame. They are constructed lazily, as the tasks are consumed.
+    names = list(parameter_samples.columns)
+    task_data = (
+        (idx, dict(zip(names, row)))
+        for idx, row in enumerate(parameter_samples.itertuples(index=False, name=None))
     )
-    task_data = parameter_samples.iterrows()
+    num_samples = len(parameter_samples)
 
     if pool is not None:
-        polarizations_list = pool.map(task_func, task_data)
+        # Send tasks in large chunks to amortize the inter-process communication.
+        # Results are accepted in the order in which they complete, such that a slow
+        # chunk does not hold back the others.
+        if num_processes is None:
+            num_processes = os.cpu_count() or 1
+        chunksize = max(1, num_samples // (4 * num_processes))
+        polarizations_iter = pool.imap_unordered(
+            task_func, task_data, chunksize=chunksize
+        )
     else:
-        polarizations_list = list(map(task_func, task_data))
-    polarizations = {
-        pol: np.stack([wf[pol] for wf in polarizations_list])
-        for pol in polarizations_list[0].keys()
-    }
+        polarizations_iter = map(task_func, task_data)
+
+    # Fill preallocated arrays as the waveforms come in, rather than stacking a list
+    # of all waveforms at the end, which would hold two copies in memory.
+    polarizations = None
+    for idx, wf in polarizations_iter:
+        if polarizations is None:
+            polarizations = {
+                pol: np.empty((num_samples,) + v.shape, dtype=v.dtype)
+                for pol, v in wf.items()
+            }
+        for pol, v in wf.items():
+            polarizations[pol][idx] = v
     return polarizations
 
 
@@ -1361,10 +1616,13 @@ def sum_contributions_m(x_m, phase_shift=0.0):
     Sum the contributions over m-components, optionally introducing a phase shift.
     """
     keys = next(iter(x_m.values())).keys()
-    result = {key: 0.0 for key in keys}
+    # The sum over m is computed as a single contraction of the phase factors with the
+    # stacked contributions, rather than accumulating one m at a time.
+    phase_factors = np.exp(-1j * np.array(list(x_m.keys())) * phase_shift)
+    result = {}
     for key in keys:
-        for m, x in x_m.items():
-            result[key] += x[key] * np.exp(-1j * m * phase_shift)
+        x_stacked = np.stack([x[key] for x in x_m.values()])
+        result[key] = np.tensordot(phase_factors, x_stacked, axes=1)
     return result
 
 
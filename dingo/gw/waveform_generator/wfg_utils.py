@@ -1,16 +1,72 @@
+from functools import lru_cache
+
 import numpy as np
 import lal
 import lalsimulation as LS
 
 
-def linked_list_modes_to_dict_modes(hlm_ll):
-    """Convert linked list of modes into dictionary with keys (l,m)."""
+@lru_cache(maxsize=4)
+def _get_forward_fft_plan(chirplen: int):
+    """Forward complex FFT plan of length chirplen. Plans are cached, since setting up
+    the plan can cost more than the FFT itself, and the length is typically the same
+    for all waveforms of a dataset."""
+    return lal.CreateForwardCOMPLEX16FFTPlan(chirplen, 0)
+
+
+# (sample_frequencies, transform setup) of the last call of _get_fd_transform_setup.
+_fd_transform_setup_cache = None
+
+
+def _get_fd_transform_setup(domain):
+    """
+    Quantities for the FFT of TD modes to the frequency domain, which only depend on
+    the domain: (delta_f, delta_t, chirplen, freqs, fft_plan). Here, freqs are the
+    frequencies -f_max,...,-f_min,...0,...,f_min,...,f_max (read-only).
+
+    The result is cached, and recomputed only when the domain creates a new sample
+    frequency array, i.e., when its settings change.
+    """
+    global _fd_transform_setup_cache
+    sample_frequencies = domain()
+    if (
+        _fd_transform_setup_cache is None
+        or _fd_transform_setup_cache[0] is not sample_frequencies
+    ):
+        delta_f = domain.delta_f
+        delta_t = 0.5 / domain.f_max
+        f_nyquist = domain.f_max  # use f_max as f_nyquist
+        n = round(f_nyquist / delta_f)
+        if (n & (n - 1)) != 0:
+            raise NotImplementedError("f_nyquist not a power of two of delta_f.")
+        chirplen = int(2 * f_nyquist / delta_f)
+        # sample frequencies, -f_max,...,-f_min,...0,...,f_min,...,f_max
+        freqs = np.concatenate(
+            (-sample_frequencies[::-1], sample_frequencies[1:]), axis=0
+        )
+        freqs.flags.writeable = False
+        # For even chirplength, we get chirplen + 1 output frequencies. However, the
+        # f_max and -f_max bins are redundant, so we have chirplen unique bins.
+        assert len(freqs) == chirplen + 1
+        setup = (delta_f, delta_t, chirplen, freqs, _get_forward_fft_plan(chirplen))
+        _fd_transform_setup_cache = (sample_frequencies, setup)
+    return _fd_transform_setup_cache[1]
+
+
+def linked_list_modes_to_dict_modes(hlm_ll, as_arrays: bool = False):
+    """Convert linked list of modes into dictionary with keys (l,m).
+
+    If as_arrays, the values are the data arrays of the modes (mode.data.data) rather
+    than the lal series objects, extracted in the same pass over the linked list.
+    """
     hlm_dict = {}
 
     mode = hlm_ll.this
     while mode is not None:
         l, m = mode.l, mode.m
-        hlm_dict[(l, m)] = mode.mode
+        if as_arrays:
+            hlm_dict[(l, m)] = mode.mode.data.data
+        else:
+            hlm_dict[(l, m)] = mode.mode
         mode = mode.next
 
     return hlm_dict
@@ -39,13 +95,21 @@ def get_tapering_window_for_complex_time_series(h, tapering_flag: int = 1):
     window: np.ndarray
         Array of length h.data.length, with the window used for tapering.
     """
+    h_data = h.data.data
     h_tapered = lal.CreateREAL8TimeSeries(
-        "h_tapered", h.epoch, 0, h.deltaT, None, h.data.length
+        "h_tapered", h.epoch, 0, h.deltaT, None, len(h_data)
     )
-    h_tapered.data.data = h.data.data.copy().real
+    # The assignment copies the real part into the lal series.
+    h_tapered.data.data = h_data.real
     LS.SimInspiralREAL8WaveTaper(h_tapered.data, tapering_flag)
-    eps = 1e-20 * np.max(np.abs(h.data.data))
-    window = (np.abs(h_tapered.data.data) + eps) / (np.abs(h.data.data.real) + eps)
+    eps = 1e-20 * np.max(np.abs(h_data))
+    # window = (|h_tapered| + eps) / (|Re(h)| + eps), computed in place to avoid
+    # temporary arrays.
+    window = np.abs(h_tapered.data.data)
+    window += eps
+    denominator = np.abs(h_data.real)
+    denominator += eps
+    window /= denominator
     # FIXME: using eps for numerical stability is not really robust here
     return window
 
@@ -67,7 +131,11 @@ def taper_td_modes_in_place(hlm_td, tapering_flag: int = 1):
     """
     for _, h in hlm_td.items():
         window = get_tapering_window_for_complex_time_series(h, tapering_flag)
-        h.data.data *= window
+        # Multiply the view of the lal data in place. Note that h.data.data *= window
+        # would in addition assign the result back through the SWIG wrapper, i.e.,
+        # copy the data onto itself.
+        h_data = h.data.data
+        h_data *= window
 
 
 def td_modes_to_fd_modes(hlm_td, domain):
@@ -89,23 +157,18 @@ def td_modes_to_fd_modes(hlm_td, domain):
         Dictionary with (l,m) keys and numpy arrays with the corresponding modes as
         values.
     """
-    hlm_fd = {}
-
-    delta_f = domain.delta_f
-    delta_t = 0.5 / domain.f_max
-    f_nyquist = domain.f_max  # use f_max as f_nyquist
-    n = round(f_nyquist / delta_f)
-    if (n & (n - 1)) != 0:
-        raise NotImplementedError("f_nyquist not a power of two of delta_f.")
-    chirplen = int(2 * f_nyquist / delta_f)
-    # sample frequencies, -f_max,...,-f_min,...0,...,f_min,...,f_max
-    freqs = np.concatenate((-domain()[::-1], domain()[1:]), axis=0)
-    # For even chirplength, we get chirplen + 1 output frequencies. However, the f_max
-    # and -f_max bins are redundant, so we have chirplen unique bins.
-    assert len(freqs) == chirplen + 1
-
-    lal_fft_plan = lal.CreateForwardCOMPLEX16FFTPlan(chirplen, 0)
-    for lm, h_td in hlm_td.items():
+    delta_f, delta_t, chirplen, freqs, lal_fft_plan = _get_fd_transform_setup(domain)
+    # Initialize a lal frequency series, which is reused for all modes. We choose
+    # length chirplen + 1, while h_td is only of length chirplen. This means, that the
+    # last bin h_fd.data.data[-1] will not be modified by the lal FFT, and we have to
+    # copy over h_fd.data.data[0] to h_fd.data.data[-1]. This corresponds to setting
+    # h(-f_max) = h(f_max).
+    h_fd = None
+    # The FD modes are collected in the rows of a single array, such that the time
+    # shift can be applied to all of them at once.
+    hlm_fd_stacked = np.empty((len(hlm_td), chirplen + 1), dtype=complex)
+    dts = np.empty(len(hlm_td))
+    for idx, h_td in enumerate(hlm_td.values()):
         assert np.abs(h_td.deltaT - delta_t) < 1e-12
 
         # resize data to chirplen by zero-padding or truncating
@@ -118,42 +181,53 @@ def td_modes_to_fd_modes(hlm_td, domain):
         #     )
         lal.ResizeCOMPLEX16TimeSeries(h_td, h_td.data.length - chirplen, chirplen)
 
-        # Initialize a lal frequency series. We choose length chirplen + 1, while h_td is
-        # only of length chirplen. This means, that the last bin h_fd.data.data[-1]
-        # will not be modified by the lal FFT, and we have to copy over h_fd.data.data[0]
-        # to h_fd.data.data[-1]. This corresponds to setting h(-f_max) = h(f_max).
-        h_fd = lal.CreateCOMPLEX16FrequencySeries(
-            "h_fd", h_td.epoch, 0, delta_f, None, chirplen + 1
-        )
-        # apply FFT
+        if h_fd is None:
+            h_fd = lal.CreateCOMPLEX16FrequencySeries(
+                "h_fd", h_td.epoch, 0, delta_f, None, chirplen + 1
+            )
+        # apply FFT (this also sets the epoch of h_fd to that of h_td)
         lal.COMPLEX16TimeFreqFFT(h_fd, h_td, lal_fft_plan)
         assert np.abs(h_fd.deltaF - delta_f) < 1e-10
         assert np.abs(h_fd.f0 + domain.f_max) < 1e-6
 
-        # time shift
-        dt = (
+        # Copy, so h_fd can be overwritten by the next mode.
+        hlm_fd_stacked[idx] = h_fd.data.data
+        dts[idx] = (
             1.0 / h_fd.deltaF + h_fd.epoch.gpsSeconds + h_fd.epoch.gpsNanoSeconds * 1e-9
         )
-        hlm_fd[lm] = h_fd.data.data * np.exp(-1j * 2 * np.pi * dt * freqs)
-        # Set h(-f_max) = h(f_max), see above
-        hlm_fd[lm][-1] = hlm_fd[lm][0]
 
-    return hlm_fd
+    # time shift. The modes generally share the same epoch, in which case the phase
+    # factor is computed only once. The time shifts are passed as Python floats, such
+    # that the phase factor is computed in the precision of freqs.
+    if len(set(dts)) == 1:
+        time_shift = np.exp(-1j * 2 * np.pi * float(dts[0]) * freqs)
+    else:
+        time_shift = np.stack(
+            [np.exp(-1j * 2 * np.pi * float(dt) * freqs) for dt in dts]
+        )
+    hlm_fd_stacked *= time_shift
+    # Set h(-f_max) = h(f_max), see above
+    hlm_fd_stacked[:, -1] = hlm_fd_stacked[:, 0]
+
+    return dict(zip(hlm_td.keys(), hlm_fd_stacked))
 
 
 def get_polarizations_from_fd_modes_m(hlm_fd, iota, phase):
     pol_m = {}
-    polarizations = ["h_plus", "h_cross"]
+    # Positive and negative frequency contributions to pol_m[m], summed separately.
+    # h_plus and h_cross are only assembled from these sums at the end, which avoids
+    # temporary arrays for every mode.
+    h_pos_m = {}
+    h_neg_m = {}
 
     for (l, m), h in hlm_fd.items():
         if m not in pol_m:
-            pol_m[m] = {k: 0.0 for k in polarizations}
-            pol_m[-m] = {k: 0.0 for k in polarizations}
+            pol_m[m] = None
+            pol_m[-m] = None
 
         # In the L0 frame, we compute the polarizations from the modes using the
         # spherical harmonics below.
         ylm = lal.SpinWeightedSphericalHarmonic(iota, np.pi / 2 - phase, -2, l, m)
-        ylmstar = ylm.conjugate()
 
         # Modes (l,m) are defined on domain -f_max,...,-f_min,...0,...,f_min,...,f_max.
         # This splits up the frequency series into positive and negative frequency parts.
@@ -163,16 +237,38 @@ def get_polarizations_from_fd_modes_m(hlm_fd, iota, phase):
             )
         offset = len(h) // 2
         h1 = h[offset:]
-        h2 = h[offset::-1].conj()
+        h2 = h[offset::-1]
 
         # Organize the modes such that pol_m[m] transforms as e^{- 1j * m * phase}.
         # This differs from the usual way, e.g.,
         #   https://lscsoft.docs.ligo.org/lalsuite/lalsimulation/
         #   _l_a_l_sim_inspiral_8c_source.html#l04801
-        pol_m[m]["h_plus"] += 0.5 * h1 * ylm
-        pol_m[-m]["h_plus"] += 0.5 * h2 * ylmstar
-        pol_m[m]["h_cross"] += 0.5 * 1j * h1 * ylm
-        pol_m[-m]["h_cross"] += -0.5 * 1j * h2 * ylmstar
+        # The scalar prefactors are combined before multiplying the arrays, and the
+        # positive and negative frequency parts are computed once and reused for
+        # h_plus and h_cross, where
+        #   0.5 * h2.conj() * ylmstar = (0.5 * h2 * ylm).conj().
+        # pol_m[m] receives
+        #   h_plus += h1_ylm,       h_cross += 1j * h1_ylm,
+        # and pol_m[-m] receives
+        #   h_plus += h2_ylmstar,   h_cross += -1j * h2_ylmstar.
+        h1_ylm = h1 * (0.5 * ylm)
+        h2_ylmstar = h2 * (0.5 * ylm)
+        np.conjugate(h2_ylmstar, out=h2_ylmstar)
+        if m in h_pos_m:
+            h_pos_m[m] += h1_ylm
+        else:
+            h_pos_m[m] = h1_ylm
+        if -m in h_neg_m:
+            h_neg_m[-m] += h2_ylmstar
+        else:
+            h_neg_m[-m] = h2_ylmstar
+
+    for m in pol_m:
+        h_pos = h_pos_m.get(m, 0.0)
+        h_neg = h_neg_m.get(m, 0.0)
+        h_cross = h_pos - h_neg
+        h_cross *= 1j
+        pol_m[m] = {"h_plus": h_pos + h_neg, "h_cross": h_cross}
 
     return pol_m
 
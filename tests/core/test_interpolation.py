@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from dingo.core.density import (
+    interpolated_sample_and_log_prob_multi,
+    interpolated_log_prob_multi,
+)
+from dingo.core.density.interpolation import interpolated_log_prob
+
+
+@pytest.fixture()
+def phase_posteriors():
+    rng = np.random.default_rng(0)
+    sample_points = np.linspace(0, 2 * np.pi, 51)
+    shifts = rng.uniform(0, 2 * np.pi, size=(100, 1))
+    values = np.exp(3 * np.cos(2 * sample_points - shifts)) + 0.01
+    return sample_points, values
+
+
+def test_interpolated_sample_and_log_prob_multi(phase_posteriors):
+    sample_points, values = phase_posteriors
+    sample, log_prob = interpolated_sample_and_log_prob_multi(sample_points, values)
+    assert sample.shape == log_prob.shape == (len(values),)
+    assert np.all((sample >= sample_points[0]) & (sample <= sample_points[-1]))
+    log_prob_ref = [
+        interpolated_log_prob(sample_points, v, s) for v, s in zip(values, sample)
+    ]
+    assert np.allclose(log_prob, log_prob_ref)
+
+
+def test_interpolated_log_prob_multi(phase_posteriors):
+    sample_points, values = phase_posteriors
+    evaluation_points = np.random.uniform(0, 2 * np.pi, size=len(values))
+    log_prob = interpolated_log_prob_multi(sample_points, values, evaluation_points)
+    log_prob_ref = [
+        interpolated_log_prob(sample_points, v, x)
+        for v, x in zip(values, evaluation_points)
+    ]
+    assert np.allclose(log_prob, log_prob_ref)
+
+
+def test_interpolated_sample_and_log_prob_multi_torch(phase_posteriors):
+    sample_points, values = phase_posteriors
+    sample, log_prob = interpolated_sample_and_log_prob_multi(
+        sample_points, values, device="cpu"
+    )
+    assert sample.shape == log_prob.shape == (len(values),)
+    log_prob_ref = [
+        interpolated_log_prob(sample_points, v, s) for v, s in zip(values, sample)
+    ]
+    assert np.allclose(log_prob, log_prob_ref)
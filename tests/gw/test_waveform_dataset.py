@@ -1,7 +1,9 @@
 import os
+import pickle
 import uuid
 
 import numpy as np
+import pandas as pd
 import pytest
 
 from dingo.gw.domains import Domain
@@ -158,4 +160,110 @@ def test_load_waveform_dataset(generate_waveform_dataset_small):
         # below f_min_new check
         assert np.all(wd2[0]['waveform'][pol][:int(f_min_new)] == 0.0)
     assert len(wd2.domain) == f_max_new / delta_f + 1
-    assert len(wd2.domain) == len(wd2.domain())
\ No newline at end of file
+    assert len(wd2.domain) == len(wd2.domain())
+
+
+def waveform_dataset_dictionary(num_samples=6, svd_size=None, whitening=None):
+    """Small dataset with random polarizations, for use with
+    WaveformDataset(dictionary=...). If svd_size is provided, the polarizations are
+    SVD compressed with a random basis of that size."""
+    rng = np.random.default_rng(0)
+    domain_settings = {
+        "type": "FrequencyDomain",
+        "f_min": 20.0,
+        "f_max": 64.0,
+        "delta_f": 1.0,
+    }
+    num_bins = 65
+    compression = {}
+    if whitening is not None:
+        compression["whitening"] = whitening
+    if svd_size is not None:
+        compression["svd"] = {"size": svd_size}
+    size = num_bins if svd_size is None else svd_size
+    dictionary = {
+        "settings": {"domain": domain_settings, "compression": compression},
+        "parameters": pd.DataFrame({"chirp_mass": rng.uniform(size=num_samples)}),
+        "polarizations": {
+            pol: rng.normal(size=(num_samples, size))
+            + 1j * rng.normal(size=(num_samples, size))
+            for pol in ["h_plus", "h_cross"]
+        },
+    }
+    if svd_size is not None:
+        V = np.linalg.qr(
+            rng.normal(size=(num_bins, svd_size))
+            + 1j * rng.normal(size=(num_bins, svd_size))
+        )[0]
+        dictionary["svd"] = {"V": V, "s": np.ones(svd_size)}
+    return dictionary
+
+
+def scale_by_chirp_mass(sample):
+    """Transform depending on both the parameters and the waveform."""
+    scale = sample["parameters"]["chirp_mass"]
+    return {
+        "parameters": sample["parameters"],
+        "waveform": {k: v * scale for k, v in sample["waveform"].items()},
+    }
+
+
+def test_waveform_dataset_getitems():
+    """Check that batched access is equivalent to accessing single elements, with SVD
+    decompression, whitening and a per-sample transform."""
+    wd = WaveformDataset(
+        dictionary=waveform_dataset_dictionary(
+            svd_size=4, whitening="aLIGO_ZERO_DET_high_P_asd.txt"
+        ),
+        transform=scale_by_chirp_mass,
+    )
+    indices = [2, 0, 1, 2]
+    batch = wd.__getitems__(indices)
+    assert len(batch) == len(indices)
+    for el_batch, idx in zip(batch, indices):
+        el_single = wd[idx]
+        assert el_batch["parameters"] == el_single["parameters"]
+        for pol in ["h_cross", "h_plus"]:
+            a = el_batch["waveform"][pol]
+            b = el_single["waveform"][pol]
+            # Whitened waveforms are small, so compare relative to their scale.
+            scale_factor = np.max(np.abs(b))
+            assert len(a) == len(wd.domain)
+            assert np.allclose(a / scale_factor, b / scale_factor)
+
+
+def test_lazy_waveform_dataset_with_domain_update(tmp_path):
+    """Check that lazily loaded polarizations agree with those held in memory, when
+    the domain is updated while reading."""
+    path = str(tmp_path / "waveform_dataset.hdf5")
+    WaveformDataset(dictionary=waveform_dataset_dictionary()).to_file(path)
+
+    domain_update = {"f_min": 30.0, "f_max": 50.0}
+    wd = WaveformDataset(file_name=path, domain_update=domain_update, lazy=True)
+    wd_eager = WaveformDataset(file_name=path, domain_update=domain_update)
+    indices = [2, 0, 1]
+    for el_lazy, el_eager in zip(
+        wd.__getitems__(indices), wd_eager.__getitems__(indices)
+    ):
+        for pol in ["h_cross", "h_plus"]:
+            assert len(el_lazy["waveform"][pol]) == len(wd.domain)
+            assert np.allclose(el_lazy["waveform"][pol], el_eager["waveform"][pol])
+    for idx in indices:
+        for pol in ["h_cross", "h_plus"]:
+            assert np.allclose(wd[idx]["waveform"][pol], wd_eager[idx]["waveform"][pol])
+
+
+def test_pickle_lazy_waveform_dataset_with_svd_size_update(tmp_path):
+    """Check that a lazily loaded dataset with a truncated SVD can be pickled (as
+    required for DataLoader workers), and yields the same samples afterwards."""
+    path = str(tmp_path / "waveform_dataset.hdf5")
+    WaveformDataset(dictionary=waveform_dataset_dictionary(svd_size=4)).to_file(path)
+
+    wd = WaveformDataset(file_name=path, lazy=True, svd_size_update=2)
+    wd_eager = WaveformDataset(file_name=path, svd_size_update=2)
+    wd_unpickled = pickle.loads(pickle.dumps(wd))
+    for idx in range(len(wd)):
+        for pol in ["h_plus", "h_cross"]:
+            assert np.allclose(
+                wd_unpickled[idx]["waveform"][pol], wd_eager[idx]["waveform"][pol]
+            )
@@ -1,10 +1,17 @@
-from dingo.gw.domains import FrequencyDomain
-from dingo.gw.waveform_generator.waveform_generator import WaveformGenerator
-from dingo.gw.transforms.parameter_transforms import StandardizeParameters
-import pytest
+import pickle
+
 import numpy as np
+import pytest
 import torch
 import torch.distributions
+from bilby.gw.conversion import convert_to_lal_binary_black_hole_parameters
+
+from dingo.gw.domains import FrequencyDomain
+from dingo.gw.waveform_generator.waveform_generator import (
+    WaveformGenerator,
+    _convert_to_lal_binary_black_hole_parameters,
+)
+from dingo.gw.transforms.parameter_transforms import StandardizeParameters
 
 
 @pytest.fixture
@@ -48,6 +55,42 @@ def test_waveform_generator_FD(uniform_fd_domain, wf_parameters):
     assert domain()[domain.frequency_mask][0] == domain.f_min
 
 
+def test_waveform_generator_time_shift_cache(uniform_fd_domain):
+    """Check that cached time shifts are correct, and that the cache is bounded."""
+    wf_gen = WaveformGenerator('IMRPhenomPv2', uniform_fd_domain, 20.0)
+    frequency_array = uniform_fd_domain()
+    for dt in np.linspace(0.0, 1.0, 20):
+        time_shift = wf_gen._get_time_shift(dt, frequency_array)
+        assert np.allclose(time_shift, np.exp(-2j * np.pi * dt * frequency_array))
+        assert wf_gen._get_time_shift(dt, frequency_array) is time_shift
+    assert len(wf_gen._time_shift_cache) <= 8
+
+
+def test_waveform_generator_pickle(uniform_fd_domain, precessing_spin_wf_parameters):
+    """Check that a generator with a mode list can be pickled, e.g., for sending it to
+    worker processes."""
+    parameters, f_ref, _ = precessing_spin_wf_parameters
+    wf_gen = WaveformGenerator(
+        'IMRPhenomXPHM', uniform_fd_domain, f_ref, mode_list=[(2, 2), (2, -2)]
+    )
+    wf_gen_2 = pickle.loads(pickle.dumps(wf_gen))
+    assert wf_gen_2.lal_params is not None
+    wf_dict = wf_gen.generate_hplus_hcross(parameters)
+    wf_dict_2 = wf_gen_2.generate_hplus_hcross(parameters)
+    for pol in ['h_plus', 'h_cross']:
+        assert np.allclose(wf_dict[pol], wf_dict_2[pol])
+
+
+def test_convert_to_lal_binary_black_hole_parameters(wf_parameters):
+    """Check the fast path for the standard parameterization against bilby."""
+    parameters = {**wf_parameters[0], 'geocent_time': 0.0}
+    p = _convert_to_lal_binary_black_hole_parameters(parameters)
+    p_ref, _ = convert_to_lal_binary_black_hole_parameters(parameters)
+    assert p.keys() >= parameters.keys()
+    for k, v in p_ref.items():
+        assert np.isclose(p[k], v, rtol=1e-14)
+
+
 def test_waveform_generator_FD_f_max_failure(precessing_spin_wf_parameters):
     """Specialized checks for time-domain waveforms.
 